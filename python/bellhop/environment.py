@@ -8,7 +8,7 @@ replacing manual option checking with field validators.
 
 from collections.abc import MutableMapping
 from dataclasses import dataclass, asdict, fields
-from typing import Optional, Union, Any, Dict, Iterator
+from typing import Optional, Union, Any, ClassVar, Dict, Iterator, Tuple
 from pprint import pformat
 import warnings
 
@@ -17,6 +17,17 @@ import pandas as _pd
 
 from .constants import _Strings, _Maps, Defaults
 
+def _strictly_increasing(x: Any) -> bool:
+    """Check a 1D array is strictly increasing, comparing neighbours without an np.diff() temporary"""
+    return bool((x[1:] > x[:-1]).all())
+
+def _check_range_profile(arr: Any, name: str, max_range: float) -> None:
+    """Assertions for an Nx2 array of [range, value] rows extending to at least `max_range`"""
+    assert arr.ndim == 2 and arr.shape[1] == 2, f'{name} must be a scalar or an Nx2 array [ranges, values]'
+    ranges = arr[:,0]
+    assert ranges[-1] >= max_range, f'Last range in {name} array must be beyond maximum range: {max_range} m'
+    assert _strictly_increasing(ranges), f'{name} array must be strictly monotonic in range'
+
 @dataclass
 class Environment(MutableMapping[str, Any]):
     """Dataclass for underwater acoustic environment configuration.
@@ -112,19 +123,32 @@ class Environment(MutableMapping[str, Any]):
     fg_pH: Optional[float] = None
     fg_depth: Optional[float] = None
 
+    # Set (outside the dataclass fields) once check() passes; cleared when any field is reassigned
+    _checked: ClassVar[bool] = False
+
 
     def check(self) -> "Environment":
+        """Finalise and validate the environment, raising ValueError if it is invalid.
+
+        The result is remembered until a field is assigned a new value, so repeated
+        checks of an unchanged environment are free. Arrays modified in place are not
+        detected; assign a new array instead.
+        """
+        if self._checked:
+            return self
         self._finalise()
+        max_range = _np.max(self['receiver_range'])
         try:
             self._check_env_header()
-            self._check_env_surface()
-            self._check_env_depth()
+            self._check_env_surface(max_range)
+            self._check_env_depth(max_range)
             self._check_env_ssp()
             self._check_env_sbp()
             self._check_env_beam()
-            return self
         except AssertionError as e:
             raise ValueError(f"Env check error: {str(e)}") from None
+        object.__setattr__(self, "_checked", True)
+        return self
 
     def _finalise(self) -> "Environment":
         """Reviews the data within an environment and updates settings for consistency.
@@ -146,7 +170,7 @@ class Environment(MutableMapping[str, Any]):
                 self['depth_max'] = self['depth']
             else:
                 # depth : Nx2 array = [ranges,depths]
-                self['depth_max'] = _np.max(self['depth'][:,1])
+                self['depth_max'] = float(self['depth'][:,1].max())
 
         if not isinstance(self['soundspeed'], _pd.DataFrame):
             if _np.size(self['soundspeed']) == 1:
@@ -168,26 +192,30 @@ class Environment(MutableMapping[str, Any]):
             else:
                 raise ValueError("Soundspeed array must be a 2xN array (better to use a DataFrame)")
 
-        if "depth" in self["soundspeed"].columns:
+        ssp_columns = self["soundspeed"].columns
+        if "depth" in ssp_columns:
             self["soundspeed"] = self["soundspeed"].set_index("depth")
+            ssp_columns = self["soundspeed"].columns
 
-        if len(self['soundspeed'].columns) > 1:
+        if len(ssp_columns) > 1:
             self['soundspeed_interp'] == _Strings.quadrilateral
 
+        min_range = _np.min(self['receiver_range'])
+
         # Beam angle ranges default to half-space if source is left-most, otherwise full-space:
         if self['beam_angle_min'] is None:
-            if _np.min(self['receiver_range']) < 0:
+            if min_range < 0:
                 self['beam_angle_min'] = - Defaults.beam_angle_fullspace
             else:
                 self['beam_angle_min'] = - Defaults.beam_angle_halfspace
         if self['beam_angle_max'] is None:
-            if _np.min(self['receiver_range']) < 0:
+            if min_range < 0:
                 self['beam_angle_max'] =  Defaults.beam_angle_fullspace
             else:
                 self['beam_angle_max'] = Defaults.beam_angle_halfspace
 
         self['box_depth'] = self['box_depth'] or 1.01 * self['depth_max']
-        self['box_range'] = self['box_range'] or 1.01 * (_np.max(self['receiver_range']) - min(0,_np.min(self['receiver_range'])))
+        self['box_range'] = self['box_range'] or 1.01 * (_np.max(self['receiver_range']) - min(0, min_range))
 
         return self
 
@@ -196,25 +224,17 @@ class Environment(MutableMapping[str, Any]):
         assert self['type'] == '2D', 'Not a 2D environment'
         assert self["_num_media"] == 1, f"BELLHOP only supports 1 medium, found {self['_num_media']}"
 
-    def _check_env_surface(self) -> None:
-        max_range = _np.max(self['receiver_range'])
+    def _check_env_surface(self, max_range: float) -> None:
         if self['surface'] is not None:
             assert _np.size(self['surface']) > 1, 'surface must be an Nx2 array'
-            assert self['surface'].ndim == 2, 'surface must be a scalar or an Nx2 array'
-            assert self['surface'].shape[1] == 2, 'surface must be a scalar or an Nx2 array'
+            _check_range_profile(self['surface'], 'surface', max_range)
             assert self['surface'][0,0] <= 0, 'First range in surface array must be 0 m'
-            assert self['surface'][-1,0] >= max_range, 'Last range in surface array must be beyond maximum range: '+str(max_range)+' m'
-            assert _np.all(_np.diff(self['surface'][:,0]) > 0), 'surface array must be strictly monotonic in range'
         if self["surface_reflection_coefficient"] is not None:
             assert self["surface_boundary_condition"] == _Strings.from_file, "TRC values need to be read from file"
 
-    def _check_env_depth(self) -> None:
-        max_range = _np.max(self['receiver_range'])
+    def _check_env_depth(self, max_range: float) -> None:
         if _np.size(self['depth']) > 1:
-            assert self['depth'].ndim == 2, 'depth must be a scalar or an Nx2 array [ranges, depths]'
-            assert self['depth'].shape[1] == 2, 'depth must be a scalar or an Nx2 array [ranges, depths]'
-            assert self['depth'][-1,0] >= max_range, 'Last range in depth array must be beyond maximum range: '+str(max_range)+' m'
-            assert _np.all(_np.diff(self['depth'][:,0]) > 0), 'Depth array must be strictly monotonic in range'
+            _check_range_profile(self['depth'], 'depth', max_range)
             assert self["_bathymetry"] == _Strings.from_file, 'len(depth)>1 requires BTY file'
         if self["bottom_reflection_coefficient"] is not None:
             assert self["bottom_boundary_condition"] == _Strings.from_file, "BRC values need to be read from file"
@@ -222,31 +242,37 @@ class Environment(MutableMapping[str, Any]):
         assert _np.max(self['receiver_depth']) <= self['depth_max'], 'receiver_depth cannot exceed water depth: '+str(self['depth_max'])+' m'
 
     def _check_env_ssp(self) -> None:
-        assert isinstance(self['soundspeed'], _pd.DataFrame), 'Soundspeed should always be a DataFrame by this point'
-        assert self['soundspeed'].size > 1, "Soundspeed DataFrame should have been constructed internally to be two elements"
-        if self['soundspeed'].size > 1:
-            if len(self['soundspeed'].columns) > 1:
+        ssp = self['soundspeed']
+        assert isinstance(ssp, _pd.DataFrame), 'Soundspeed should always be a DataFrame by this point'
+        assert ssp.size > 1, "Soundspeed DataFrame should have been constructed internally to be two elements"
+        if ssp.size > 1:
+            nrows, ncols = ssp.shape
+            ssp_depths = ssp.index.to_numpy()
+            if ncols > 1:
                 assert self['soundspeed_interp'] == _Strings.quadrilateral, "SVP DataFrame with multiple columns implies quadrilateral interpolation."
             if self['soundspeed_interp'] == _Strings.spline:
-                assert self['soundspeed'].shape[0] > 3, 'soundspeed profile must have at least 4 points for spline interpolation'
+                assert nrows > 3, 'soundspeed profile must have at least 4 points for spline interpolation'
             else:
-                assert self['soundspeed'].shape[0] > 1, 'soundspeed profile must have at least 2 points'
-            assert self['soundspeed'].index[0] <= 0.0, 'First depth in soundspeed array must be 0 m'
-            assert _np.all(_np.diff(self['soundspeed'].index) > 0), 'Soundspeed array must be strictly monotonic in depth'
-            if self['depth_max'] != self['soundspeed'].index[-1]:
-                if self['soundspeed'].shape[1] > 1:
+                assert nrows > 1, 'soundspeed profile must have at least 2 points'
+            assert ssp_depths[0] <= 0.0, 'First depth in soundspeed array must be 0 m'
+            assert _strictly_increasing(ssp_depths), 'Soundspeed array must be strictly monotonic in depth'
+            if self['depth_max'] != ssp_depths[-1]:
+                if ncols > 1:
                     # TODO: generalise interpolation trimming from np approach below
-                    assert self['soundspeed'].index[-1] == self['depth_max'], '2D SSP: Final entry in soundspeed array must be at the maximum water depth: '+str(self['depth_max'])+' m'
+                    assert ssp_depths[-1] == self['depth_max'], '2D SSP: Final entry in soundspeed array must be at the maximum water depth: '+str(self['depth_max'])+' m'
                 else:
-                    indlarger = _np.argwhere(self['soundspeed'].index > self['depth_max'])[0][0]
-                    prev_ind = self['soundspeed'].index[:indlarger].tolist()
-                    insert_ss_val = _np.interp(self['depth_max'], self['soundspeed'].index, self['soundspeed'].iloc[:,0])
-                    new_row = _pd.DataFrame([self['depth_max'], insert_ss_val], columns=self['soundspeed'].columns)
-                    self['soundspeed'] = _pd.concat([
-                            self['soundspeed'].iloc[:(indlarger-1)],  # rows before insertion
-                            new_row,                             # new row
-                        ], ignore_index=True)
-                    self['soundspeed'].index = prev_ind + [self['depth_max']]
+                    assert ssp_depths[-1] > self['depth_max'], 'Final entry in soundspeed array must reach the maximum water depth: '+str(self['depth_max'])+' m'
+                    # keep the profile above depth_max and end it with an interpolated point at depth_max
+                    idx = int(_np.searchsorted(ssp_depths, self['depth_max']))
+                    speeds = ssp.iloc[:,0].to_numpy()
+                    new_depths = _np.empty(idx+1)
+                    new_depths[:idx] = ssp_depths[:idx]
+                    new_depths[idx] = self['depth_max']
+                    new_speeds = _np.empty(idx+1)
+                    new_speeds[:idx] = speeds[:idx]
+                    new_speeds[idx] = _np.interp(self['depth_max'], ssp_depths, speeds)
+                    self['soundspeed'] = _pd.DataFrame(new_speeds, columns=ssp.columns, index=new_depths)
+                    self['soundspeed'].index.name = ssp.index.name
                     warnings.warn("Bellhop.py has used linear interpolation to ensure the sound speed profile ends at the max depth. Ensure this is what you want.", UserWarning)
                     print("ATTEMPTING TO FIX")
             # TODO: check soundspeed range limits
@@ -256,7 +282,8 @@ class Environment(MutableMapping[str, Any]):
             assert _np.size(self['source_directionality']) > 1, 'source_directionality must be an Nx2 array'
             assert self['source_directionality'].ndim == 2, 'source_directionality must be an Nx2 array'
             assert self['source_directionality'].shape[1] == 2, 'source_directionality must be an Nx2 array'
-            assert _np.all(self['source_directionality'][:,0] >= -180) and _np.all(self['source_directionality'][:,0] <= 180), 'source_directionality angles must be in (-180, 180]'
+            angles = self['source_directionality'][:,0]
+            assert angles.min() >= -180 and angles.max() <= 180, 'source_directionality angles must be in (-180, 180]'
 
     def _check_env_beam(self) -> None:
         assert self['beam_angle_min'] >= -180 and self['beam_angle_min'] <= 180, 'beam_angle_min must be in range (-180, 180]'
@@ -277,31 +304,45 @@ class Environment(MutableMapping[str, Any]):
         if not hasattr(self, key):
             raise KeyError(f"Unknown environment configuration parameter: {key!r}")
         # Generalized validation of values
-        allowed = getattr(_Maps, key, None)
-        if allowed is not None and value is not None and value not in set(allowed.values()):
-            raise ValueError(f"Invalid value for {key!r}: {value}. Allowed: {set(allowed.values())}")
+        allowed = _allowed_values.get(key)
+        if allowed is not None and value is not None and value not in allowed:
+            raise ValueError(f"Invalid value for {key!r}: {value}. Allowed: {set(allowed)}")
+        if self._checked and getattr(self, key) is not value:
+            object.__setattr__(self, "_checked", False)
         object.__setattr__(self, key, value)
 
     def __delitem__(self, key: str) -> None:
         raise KeyError("Environment parameters cannot be deleted")
 
     def __iter__(self) -> Iterator[str]:
-        return (f.name for f in fields(self))
+        return iter(_field_names)
 
     def __len__(self) -> int:
-        return len(fields(self))
+        return len(_field_names)
 
     def __repr__(self) -> str:
-        return pformat(self.to_dict())
+        # values are only formatted, so no need for the deep copy made by to_dict()
+        return pformat({k: getattr(self, k) for k in _field_names})
 
     def to_dict(self) -> Dict[str,Any]:
         """Return a dictionary representation of the environment."""
         return asdict(self)
 
     def copy(self) -> "Environment":
-        """Return a shallow copy of the environment."""
-        # Copy all fields
-        data = {f.name: getattr(self, f.name) for f in fields(self)}
-        # Return a new instance
-        new_env = type(self)(**data)
+        """Return a shallow copy of the environment.
+
+        Field values (including arrays) are shared with the original rather than
+        re-validated, and a checked environment stays checked.
+        """
+        new_env = object.__new__(type(self))
+        new_env.__dict__.update(self.__dict__)
         return new_env
+
+
+# Field names in definition order, for iteration without calling fields() each time
+_field_names: Tuple[str, ...] = tuple(f.name for f in fields(Environment))
+
+# Allowed values of the fields with option mappings, built once rather than on every assignment
+_allowed_values: Dict[str, frozenset[str]] = {
+    f.name: frozenset(getattr(_Maps, f.name).values()) for f in fields(Environment) if hasattr(_Maps, f.name)
+}
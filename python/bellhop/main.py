@@ -179,22 +179,24 @@ def create_env(**kv: Any) -> Environment:
     >>> env = bh.create_env(depth=[[0,20], [300,10], [500,18], [1000,15]])
     """
     env = Environment()
+    env_keys = env.keys()
 
     # Apply user-provided values to environment
     for k, v in kv.items():
-        if k not in env.keys():
+        if k not in env_keys:
             raise KeyError('Unknown key: '+k)
 
         # Convert everything to ndarray except DataFrames and scalars
-        if isinstance(v, _pd.DataFrame):
-            env[k] = v
-        elif _np.isscalar(v):
+        if type(v) in _create_env_passthrough or isinstance(v, _pd.DataFrame) or _np.isscalar(v):
             env[k] = v
         else:
             env[k] = _np.asarray(v, dtype=_np.float64)
 
     return env
 
+# Exact types stored as given by create_env, checked before the slower isinstance/isscalar tests
+_create_env_passthrough = frozenset({int, float, str, bool, _pd.DataFrame})
+
 
 
 def check_env(env: Environment) -> Environment:
@@ -226,7 +228,6 @@ def check_env(env: Environment) -> Environment:
     >>> env = check_env(env)
     """
 
-    env._finalise()
     return env.check()
 
 
@@ -15,7 +15,6 @@ from typing import Any, Optional
 from sys import float_info as _fi
 
 import numpy as _np
-import scipy.interpolate as _interp
 import pandas as _pd
 
 import matplotlib.pyplot as _pyplt
@@ -157,6 +156,7 @@ def plot_ssp(env: Environment, **kwargs: Any) -> None:
         svp = _np.hstack((_np.array([svp.index]).T, _np.asarray(svp)))
     if env['soundspeed_interp'] == _Strings.spline:
         ynew = _np.linspace(_np.min(svp[:,0]), _np.max(svp[:,0]), 100)
+        import scipy.interpolate as _interp # deferred: only needed for spline profiles
         tck = _interp.splrep(svp[:,0], svp[:,1], s=0)
         xnew = _interp.splev(ynew, tck, der=0)
         _plt.plot(xnew, -ynew, xlabel='Soundspeed (m/s)', ylabel='Depth (m)', hold=True, **kwargs)
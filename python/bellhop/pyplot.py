@@ -15,7 +15,6 @@ from typing import Any, Dict, Optional
 from sys import float_info as _fi
 
 import numpy as _np
-import scipy.interpolate as _interp
 import pandas as _pd
 
 import matplotlib.pyplot as _pyplt
@@ -148,6 +147,7 @@ def pyplot_ssp(env: Dict[str, Any], **kwargs: Any) -> None:
         _pyplt.ylabel('Depth (m)')
     elif env['soundspeed_interp'] == _Strings.spline:
         ynew = _np.linspace(_np.min(svp[:, 0]), _np.max(svp[:, 0]), 100)
+        import scipy.interpolate as _interp # deferred: only needed for spline profiles
         tck = _interp.splrep(svp[:, 0], svp[:, 1], s=0)
         xnew = _interp.splev(ynew, tck, der=0)
         _pyplt.plot(xnew, -ynew, **kwargs)
@@ -1,9 +1,12 @@
 
 import os
+import copy
+import functools
+import warnings
 
 from struct import unpack as _unpack
 from pathlib import Path
-from typing import Any, Optional, Tuple, Union, TextIO, List, cast, IO
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Union, TextIO, List, IO
 from numpy.typing import NDArray
 
 import numpy as _np
@@ -11,6 +14,61 @@ import pandas as _pd
 from bellhop.constants import _Strings, _Maps, _File_Ext
 from bellhop.environment import Environment
 
+_T = TypeVar("_T")
+
+_Stamp = Optional[Tuple[int, int, int, int]]
+
+def _one_stamp(fname: str) -> Tuple[int, int, int, int]:
+    """Inode, modification and change times, and size of a file, from a single stat"""
+    st = os.stat(fname)
+    return (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+def _file_stamp(fname: str, aux_fnames: Iterable[str] = ()) -> Tuple[_Stamp, ...]:
+    """Stamp of a file and of each auxiliary file (None if it does not exist)
+
+    The stat of the main file doubles as its existence check, raising FileNotFoundError."""
+    stamp: List[_Stamp] = [_one_stamp(fname)]
+    for aux in aux_fnames:
+        try:
+            stamp.append(_one_stamp(aux))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def _cache_by_file(*aux_ext: str, maxsize: int = 64) -> Callable[[Callable[[str], _T]], Callable[[str], _T]]:
+    """Decorator to reuse the result of a file reader while the file is unchanged.
+
+    Results are keyed on the absolute path of the file and are re-read whenever the
+    inode, modification or change time, or size of the file, or of any sibling file
+    with an extension listed in `aux_ext`, changes. The contents are not read to
+    check this, so a rewrite that keeps the same size within one tick of a coarse
+    filesystem clock is not detected. A deep copy is returned so that callers are
+    free to modify the result. At most `maxsize` files are kept, discarding the
+    least recently used.
+    """
+    def decorator(reader: Callable[[str], _T]) -> Callable[[str], _T]:
+        cache: Dict[str, Tuple[Tuple[_Stamp, ...], _T]] = {}
+
+        @functools.wraps(reader)
+        def wrapper(fname: str) -> _T:
+            path = os.path.abspath(fname)
+            base = os.path.splitext(path)[0]
+            try:
+                stamp = _file_stamp(path, [base + ext for ext in aux_ext])
+            except FileNotFoundError:
+                name = os.path.splitext(fname)[1][1:].upper()
+                raise FileNotFoundError(f"{name} file not found: {fname}") from None
+            hit = cache.pop(path, None) # re-inserted below to mark as most recently used
+            if hit is None or hit[0] != stamp:
+                hit = (stamp, reader(fname))
+            cache[path] = hit
+            if len(cache) > maxsize:
+                del cache[next(iter(cache))] # dicts keep insertion order, so this is the oldest
+            return copy.deepcopy(hit[1])
+
+        return wrapper
+    return decorator
+
 def _read_next_valid_line(f: TextIO) -> str:
     """Read the next valid text line of an input file, discarding empty content.
 
@@ -27,73 +85,101 @@ def _read_next_valid_line(f: TextIO) -> str:
         raw_line = f.readline()
         if not raw_line: # EOF
             raise EOFError("End of file reached before finding a valid line")
-        line = raw_line.split('!', 1)[0].strip()
+        line = raw_line.partition('!')[0].strip()
         if line:
             return line
 
+def _valid_lines_iter(text: str) -> Iterator[str]:
+    """Yield the lines of an input file that have content, with comments and whitespace removed.
+
+    Raises EOFError (rather than ending the iteration) once the lines are exhausted,
+    so that `next()` on the iterator behaves like `_read_next_valid_line()` on a file.
+    """
+    for raw_line in text.splitlines():
+        line = raw_line.partition('!')[0].strip()
+        if line:
+            yield line
+    raise EOFError("End of file reached before finding a valid line")
+
 def _parse_line(line: str) -> list[str]:
     """Parse a line, removing comments, /, and whitespace, and return the parts in a list"""
-    line = line.split("!", 1)[0].split('/', 1)[0].strip()
-    return line.split()
+    # (benchmarked faster than a compiled regex tokenizer; split() discards surrounding whitespace)
+    return line.partition("!")[0].partition('/')[0].split()
+
+def _get(parts: List[str], i: int) -> Optional[str]:
+    """Element `i` of a parsed line, or None if the line has fewer entries"""
+    return parts[i] if i < len(parts) else None
 
 def _unquote_string(line: str) -> str:
     """Extract string from within single quotes, possibly with commas too."""
     return line.strip().strip(",'")
 
-def _parse_vector(f: TextIO, dtype: type = float) -> Tuple[NDArray[_np.float64], int]:
+def _parse_vector(lines: Iterator[str], dtype: type = float) -> Tuple[NDArray[_np.float64], int]:
     """Parse a vector that starts with count then values, ending with '/'"""
 
     # First line is the count
-    line = _read_next_valid_line(f)
+    line = next(lines)
     linecount = int(_parse_line(line)[0])
 
     # Second line has the values
-    values_line = _read_next_valid_line(f)
-    parts = _parse_line(values_line)
-    val = [dtype(p) for p in parts]
+    values_line = next(lines)
+    val: NDArray[Any] = _np.array(_parse_line(values_line), dtype=dtype)
 
-    valout = _np.array(val) if len(val) > 1 else val[0]
+    valout: Any = val if val.size > 1 else val.item()
     return valout, linecount
 
-def _read_ssp_points(f: TextIO) -> _pd.DataFrame:
+def _read_ssp_points(lines: Iterator[str]) -> Tuple[NDArray[_np.float64], str]:
     """Read sound speed profile points until we find the bottom boundary line
 
-       Default values are according to 'EnvironmentalFile.htm'."""
+       Default values are according to 'EnvironmentalFile.htm'.
+       Returns an Nx2 array of [depth, speed] pairs; the bottom boundary line
+       is returned alongside since it has already been consumed from the iterator."""
 
-    ssp_depth: list[float] = []
-    ssp_speed: list[float] = []
-    ssp = dict(depth=0.0, speed=1500.0, speed_shear=0.0, density=1000.0, att=0.0, att_shear=0.0)
+    ssp_rows: list[list[str]] = []
+    speed = "1500.0"
 
     while True:
-        line = f.readline()
-        if not line:
-            raise EOFError("File ended during env file reading of SSP points.")
-        line = line.strip()
-        if not line: # completely empty line
-            continue
+        try:
+            line = next(lines)
+        except EOFError:
+            raise EOFError("File ended during env file reading of SSP points.") from None
         if line.startswith("'"): # Check if this is a bottom boundary line (starts with quote)
-            # This is the bottom boundary line, put it back
-            f.seek(f.tell() - len(line.encode()) - 1)
+            bottom_line = line
             break
 
-        parts = (_parse_line(line) + [None] * 6)[0:6]
-        if parts[0] is None: # empty line after stripping comments
+        parts = _parse_line(line)[0:2]
+        if not parts: # nothing left after stripping '/' terminator
             continue
-        ssp.update({
-            k: float(v) if v is not None else ssp[k] for k, v in zip(ssp.keys(), parts)
-        })
-        ssp_depth.append(ssp["depth"])
-        ssp_speed.append(ssp["speed"])
+        if len(parts) == 1: # a missing speed keeps its previous value
+            parts.append(speed)
+        speed = parts[1]
+        ssp_rows.append(parts)
         # TODO: add extra terms (but this needs adjustments elsewhere)
 
-    if len(ssp_speed) == 0:
+    if len(ssp_rows) == 0:
         raise ValueError("No SSP points were found in the env file.")
-    elif len(ssp_speed) == 1:
+    elif len(ssp_rows) == 1:
         raise ValueError("Only one SSP point found but at least two required (top and bottom)")
 
-    df = _pd.DataFrame(ssp_speed,index=ssp_depth,columns=["speed"])
-    df.index.name = "depth"
-    return df
+    # all rows are converted to floats in a single numpy call
+    return _np.array(ssp_rows, dtype=_np.float64), bottom_line
+
+def _read_points(f: TextIO, npoints: int, ncols: int, name: str) -> NDArray[_np.float64]:
+    """Read `npoints` rows of (at least) `ncols` numbers from the current file position.
+
+    Any extra columns, trailing '/' terminators, or '!' comments are ignored.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="loadtxt: input contained no data")
+            # '/' ends a record in list-directed input, even when attached to a value
+            data = _np.loadtxt(f, dtype=_np.float64, comments=("!", "/"),
+                               usecols=range(ncols), max_rows=npoints, ndmin=2)
+    except ValueError as e:
+        raise ValueError(f"Expected {npoints} {name} with {ncols} values each: {e}") from None
+    if data.shape[0] != npoints:
+        raise ValueError(f"Expected {npoints} {name}, but found {data.shape[0]}")
+    return data
 
 def _opt_lookup(name: str, opt: str, _map: dict[str, _Strings]) -> Optional[str]:
     opt_str = _map.get(opt)
@@ -109,8 +195,10 @@ def _int(x: Any) -> Optional[int]:
     """Permissive int-enator"""
     return None if x is None else int(x)
 
-def _prepare_filename(fname: str, ext: str, name: str) -> Tuple[str,str]:
-    """Checks filename is present and file exists."""
+def _prepare_filename(fname: str, ext: str) -> Tuple[str,str]:
+    """Adds the file extension if not present and returns the filename with and without it.
+
+    Existence is checked when the file is first stat'ed or opened by the reader."""
     if fname.endswith(ext):
         nchar = len(ext)
         fname_base = fname[:-nchar]
@@ -118,9 +206,6 @@ def _prepare_filename(fname: str, ext: str, name: str) -> Tuple[str,str]:
         fname_base = fname
         fname = fname + ext
 
-    if not os.path.exists(fname):
-        raise FileNotFoundError(f"{name} file not found: {fname}")
-
     return fname, fname_base
 
 def read_env(fname: str) -> Environment:
@@ -169,6 +254,12 @@ def read_env(fname: str) -> Environment:
 
     """
 
+    fname, _ = _prepare_filename(fname, _File_Ext.env)
+    return _read_env_file(fname)
+
+@_cache_by_file(_File_Ext.ssp, _File_Ext.bty, _File_Ext.ati, _File_Ext.sbp)
+def _read_env_file(fname: str) -> Environment:
+    """Read an .env file (and any files it references) via `EnvironmentReader`"""
     reader = EnvironmentReader(fname)
     return reader.read()
 
@@ -189,38 +280,41 @@ class EnvironmentReader:
         Args:
             fname: Path to .env file (with or without extension)
         """
-        self.fname, self.fname_base = _prepare_filename(fname, _File_Ext.env, "Environment")
+        self.fname, self.fname_base = _prepare_filename(fname, _File_Ext.env)
         self.env: Environment = Environment()
+        self._bottom_line: Optional[str] = None
 
     def read(self) -> Environment:
-        """Do the reading..."""
-        with open(self.fname, 'r') as f:
-            self._read_header(f)
-            self._read_top_boundary(f)
-            self._read_sound_speed_profile(f)
-            self._read_bottom_boundary(f)
-            self._read_sources_receivers_task(f)
-            self._read_beams_limits(f)
+        """Do the reading...
+
+        The file is small so it is read into memory in one go and parsed from its valid lines."""
+        lines = _valid_lines_iter(Path(self.fname).read_text())
+        self._read_header(lines)
+        self._read_top_boundary(lines)
+        self._read_sound_speed_profile(lines)
+        self._read_bottom_boundary(lines)
+        self._read_sources_receivers_task(lines)
+        self._read_beams_limits(lines)
         return self.env
 
-    def _read_header(self, f: TextIO) -> None:
+    def _read_header(self, lines: Iterator[str]) -> None:
         """Read environment file header"""
 
         # Line 1: Title
-        title_line = _read_next_valid_line(f)
+        title_line = next(lines)
         self.env['name'] = _unquote_string(title_line)
         # Line 2: Frequency
-        freq_line = _read_next_valid_line(f)
+        freq_line = next(lines)
         self.env['frequency'] = float(_parse_line(freq_line)[0])
         # Line 3: NMedia (should be 1 for BELLHOP)
-        nmedia_line = _read_next_valid_line(f)
+        nmedia_line = next(lines)
         self.env["_num_media"] = int(_parse_line(nmedia_line)[0])
 
-    def _read_top_boundary(self, f: TextIO) -> None:
+    def _read_top_boundary(self, lines: Iterator[str]) -> None:
         """Read environment file top boundary options (multiple lines)"""
 
         # Line 4: Top boundary options
-        topopt_line = _read_next_valid_line(f)
+        topopt_line = next(lines)
         topopt = _unquote_string(topopt_line) + "      "
         self.env["soundspeed_interp"]          = _opt_lookup("Interpolation",          topopt[0], _Maps.soundspeed_interp)
         self.env["surface_boundary_condition"] = _opt_lookup("Top boundary condition", topopt[1], _Maps.surface_boundary_condition)
@@ -233,7 +327,7 @@ class EnvironmentReader:
 
         # Line 4a: Volume attenuation params
         if self.env["volume_attenuation"] == _Strings.francois_garrison:
-            fg_spec_line = _read_next_valid_line(f)
+            fg_spec_line = next(lines)
             fg_parts = _parse_line(fg_spec_line)
             self.env["fg_salinity"]    = float(fg_parts[0])
             self.env["fg_temperature"] = float(fg_parts[1])
@@ -242,69 +336,73 @@ class EnvironmentReader:
 
         # Line 4b: Boundary condition params
         if self.env["surface_boundary_condition"] == _Strings.acousto_elastic:
-            surface_props_line = _read_next_valid_line(f)
-            surface_props = _parse_line(surface_props_line) + [None] * 6
-            self.env['surface_depth']             = _float(surface_props[0])
-            self.env['surface_soundspeed']        = _float(surface_props[1])
-            self.env['_surface_soundspeed_shear']  = _float(surface_props[2])
-            self.env['surface_density']           = _float(surface_props[3], scale=1000)  # convert from g/cm³ to kg/m³
-            self.env['surface_attenuation']       = _float(surface_props[4])
-            self.env['_surface_attenuation_shear'] = _float(surface_props[5])
-
-    def _read_sound_speed_profile(self, f: TextIO) -> None:
+            surface_props_line = next(lines)
+            surface_props = _parse_line(surface_props_line)
+            self.env['surface_depth']             = _float(_get(surface_props, 0))
+            self.env['surface_soundspeed']        = _float(_get(surface_props, 1))
+            self.env['_surface_soundspeed_shear']  = _float(_get(surface_props, 2))
+            self.env['surface_density']           = _float(_get(surface_props, 3), scale=1000)  # convert from g/cm³ to kg/m³
+            self.env['surface_attenuation']       = _float(_get(surface_props, 4))
+            self.env['_surface_attenuation_shear'] = _float(_get(surface_props, 5))
+
+    def _read_sound_speed_profile(self, lines: Iterator[str]) -> None:
         """Read environment file sound speed profile"""
 
         # SSP depth specification
-        ssp_spec_line = _read_next_valid_line(f)
-        ssp_parts = _parse_line(ssp_spec_line) + [None] * 3
-        self.env['_mesh_npts']   = _int(ssp_parts[0])
-        self.env['_depth_sigma'] = _float(ssp_parts[1])
-        self.env['depth_max']    = _float(ssp_parts[2])
+        ssp_spec_line = next(lines)
+        ssp_parts = _parse_line(ssp_spec_line)
+        self.env['_mesh_npts']   = _int(_get(ssp_parts, 0))
+        self.env['_depth_sigma'] = _float(_get(ssp_parts, 1))
+        self.env['depth_max']    = _float(_get(ssp_parts, 2))
         self.env['depth'] = self.env['depth_max']
 
         # Read SSP points and from file if applicable
-        self.env['soundspeed'] = _read_ssp_points(f)
+        ssp, self._bottom_line = _read_ssp_points(lines)
         if self.env["soundspeed_interp"] == _Strings.quadrilateral:
-            self.env['soundspeed'] = read_ssp(self.fname_base, self.env['soundspeed'].index)
+            self.env['soundspeed'] = read_ssp(self.fname_base, ssp[:,0])
+        else:
+            self.env['soundspeed'] = _pd.DataFrame(ssp[:,1], index=ssp[:,0], columns=["speed"])
+            self.env['soundspeed'].index.name = "depth"
 
-    def _read_bottom_boundary(self, f: TextIO) -> None:
+    def _read_bottom_boundary(self, lines: Iterator[str]) -> None:
         """Read environment file bottom boundary condition"""
 
         # Bottom boundary options
-        bottom_line = _read_next_valid_line(f)
-        bottom_parts = _parse_line(bottom_line) + [None] * 3
-        botopt = _unquote_string(cast(str,bottom_parts[0])) + "  " # cast() => I promise this is a str :)
+        bottom_line = self._bottom_line or next(lines)
+        self._bottom_line = None
+        bottom_parts = _parse_line(bottom_line)
+        botopt = _unquote_string(bottom_parts[0]) + "  "
         self.env["bottom_boundary_condition"] = _opt_lookup("Bottom boundary condition", botopt[0], _Maps.bottom_boundary_condition)
         self.env["_bathymetry"]               = _opt_lookup("Bathymetry",                botopt[1], _Maps._bathymetry)
-        self.env['bottom_roughness']       = _float(bottom_parts[1])
-        self.env['bottom_beta']            = _float(bottom_parts[2])
-        self.env['bottom_transition_freq'] = _float(bottom_parts[3])
+        self.env['bottom_roughness']       = _float(_get(bottom_parts, 1))
+        self.env['bottom_beta']            = _float(_get(bottom_parts, 2))
+        self.env['bottom_transition_freq'] = _float(_get(bottom_parts, 3))
         if self.env["_bathymetry"] == _Strings.from_file:
             self.env["depth"], self.env["bottom_interp"] = read_bty(self.fname_base)
 
         # Bottom properties (depth, sound_speed, density, absorption)
         if self.env["bottom_boundary_condition"] == _Strings.acousto_elastic:
-            bottom_props_line = _read_next_valid_line(f)
-            bottom_props = _parse_line(bottom_props_line) + [None] * 6
-            self.env['bottom_soundspeed'] = _float(bottom_props[1])
-            self.env['_bottom_soundspeed_shear'] = _float(bottom_props[2])
-            self.env['bottom_density'] = _float(bottom_props[3], 1000)  # convert from g/cm³ to kg/m³
-            self.env['bottom_attenuation'] = _float(bottom_props[4])
-            self.env['_bottom_attenuation_shear'] = _float(bottom_props[5])
-
-    def _read_sources_receivers_task(self, f: TextIO) -> None:
+            bottom_props_line = next(lines)
+            bottom_props = _parse_line(bottom_props_line)
+            self.env['bottom_soundspeed'] = _float(_get(bottom_props, 1))
+            self.env['_bottom_soundspeed_shear'] = _float(_get(bottom_props, 2))
+            self.env['bottom_density'] = _float(_get(bottom_props, 3), 1000)  # convert from g/cm³ to kg/m³
+            self.env['bottom_attenuation'] = _float(_get(bottom_props, 4))
+            self.env['_bottom_attenuation_shear'] = _float(_get(bottom_props, 5))
+
+    def _read_sources_receivers_task(self, lines: Iterator[str]) -> None:
         """Read environment file sources, receivers, and task"""
 
         # Source & receiver depths
-        self.env['source_depth'],   self.env['source_ndepth']   = _parse_vector(f)
-        self.env['receiver_depth'], self.env['receiver_ndepth'] = _parse_vector(f)
+        self.env['source_depth'],   self.env['source_ndepth']   = _parse_vector(lines)
+        self.env['receiver_depth'], self.env['receiver_ndepth'] = _parse_vector(lines)
 
         # Receiver ranges (in km, need to convert to m)
-        receiver_ranges, self.env['receiver_nrange'] = _parse_vector(f)
+        receiver_ranges, self.env['receiver_nrange'] = _parse_vector(lines)
         self.env['receiver_range'] = receiver_ranges * 1000  # convert km to m
 
         # Task/run type (e.g., 'R', 'C', etc.)
-        task_line = _read_next_valid_line(f)
+        task_line = next(lines)
         task_code = _unquote_string(task_line) + "    "
         self.env['task']        = _Maps.task.get(task_code[0])
         self.env['beam_type']   = _Maps.beam_type.get(task_code[1])
@@ -316,23 +414,23 @@ class EnvironmentReader:
         if self.env["_sbp_file"] == _Strings.from_file:
             self.env["source_directionality"] = read_sbp(self.fname_base)
 
-    def _read_beams_limits(self, f: TextIO) -> None:
+    def _read_beams_limits(self, lines: Iterator[str]) -> None:
         """Read environment file beams and limits"""
 
         # Number of beams
-        beam_num_line = _read_next_valid_line(f)
-        beam_num_parts = _parse_line(beam_num_line) + [None] * 1
-        self.env['beam_num'] = int(beam_num_parts[0] or 0)
-        self.env['single_beam_index'] = _int(beam_num_parts[1])
+        beam_num_line = next(lines)
+        beam_num_parts = _parse_line(beam_num_line)
+        self.env['beam_num'] = int(_get(beam_num_parts, 0) or 0)
+        self.env['single_beam_index'] = _int(_get(beam_num_parts, 1))
 
         # Beam angles (beam_angle_min, beam_angle_max)
-        angles_line = _read_next_valid_line(f)
-        angle_parts = _parse_line(angles_line) + [None] * 2
-        self.env['beam_angle_min'] = _float(angle_parts[0])
-        self.env['beam_angle_max'] = _float(angle_parts[1])
+        angles_line = next(lines)
+        angle_parts = _parse_line(angles_line)
+        self.env['beam_angle_min'] = _float(_get(angle_parts, 0))
+        self.env['beam_angle_max'] = _float(_get(angle_parts, 1))
 
         # Ray tracing limits (step, max_depth, max_range) - last line
-        limits_line = _read_next_valid_line(f)
+        limits_line = next(lines)
         limits_parts = _parse_line(limits_line)
         self.env['step_size'] = float(limits_parts[0])
         self.env['box_depth'] = float(limits_parts[1])
@@ -343,8 +441,9 @@ def read_ssp(fname: str,
              depths: Optional[Union[
                         List[float],
                         NDArray[_np.float64],
-                        _pd.DataFrame]] = None
-            ) -> Union[NDArray[_np.float64], _pd.DataFrame]:
+                        _pd.DataFrame]] = None,
+             raw: bool = False
+            ) -> Union[NDArray[_np.float64], _pd.DataFrame, Tuple[NDArray[_np.float64], NDArray[_np.float64], NDArray[_np.float64]]]:
     """Read a 2D sound speed profile (.ssp) file used by BELLHOP.
 
     This function reads BELLHOP's .ssp files which contain range-dependent
@@ -357,12 +456,17 @@ def read_ssp(fname: str,
     ----------
     fname : str
         Path to .ssp file (with or without .ssp extension)
+    depths : array_like, optional
+        Depths of the rows of sound speed data
+    raw : bool, default=False
+        True to return the sound speed array, depths and ranges without a DataFrame wrapper
 
     Returns
     -------
-    numpy.ndarray or pandas.DataFrame
+    numpy.ndarray or pandas.DataFrame or tuple
         For single-profile files: numpy array with [depth, soundspeed] pairs;
-        for multi-profile files: pandas DataFrame with range-dependent sound speed data
+        for multi-profile files: pandas DataFrame with range-dependent sound speed data;
+        if `raw` is True: a tuple of (sound speeds, depths, ranges) numpy arrays
 
     Notes
     -----
@@ -407,53 +511,70 @@ def read_ssp(fname: str,
         1500 1500 1548.52 1530.29 1526.69 1517.78 1509.49 1504.30 1501.38 1500.14 1500.12 1501.02 1502.57 1504.62 1507.02 1509.69 1512.55 1515.56 1518.67 1521.85 1525.10 1528.38 1531.70 1535.04 1538.39 1541.76 1545.14 1548.52 1551.91 1551.91
     """
 
-    fname, _ = _prepare_filename(fname, _File_Ext.ssp, "SSP")
+    fname, _ = _prepare_filename(fname, _File_Ext.ssp)
+    ranges_m, ssp_array = _read_ssp_file(fname)
+    ndepths = ssp_array.shape[0]
+
+    # Create depth indices (actual depths would normally come from associated .env file)
+    if depths is None:
+        depths = _np.arange(ndepths, dtype=float)
+
+    if ndepths == 0 or len(depths) != ndepths:
+        raise ValueError("Wrong number of depths found in sound speed data file"
+                         f" (expected {ndepths}, found {ssp_array.shape[0]})")
+
+    if raw:
+        return ssp_array, _np.asarray(depths, dtype=_np.float64), ranges_m
+
+    df = _pd.DataFrame(ssp_array, index=depths, columns=ranges_m)
+    df.index.name = "depth"
+    return df
+
+@_cache_by_file()
+def _read_ssp_file(fname: str) -> Tuple[NDArray[_np.float64], NDArray[_np.float64]]:
+    """Read the ranges (in m) and sound speed matrix from an .ssp file"""
     with open(fname, 'r') as f:
         nranges = int(_read_next_valid_line(f))
         range_line = _read_next_valid_line(f)
-        ranges = _np.array([float(x) for x in _parse_line(range_line)])
+        ranges = _np.array(_parse_line(range_line), dtype=_np.float64)
         ranges_m = ranges * 1000 # Convert ranges from km to meters (as expected by create_env)
 
         if len(ranges) != nranges:
             raise ValueError(f"Expected {nranges} ranges, but found {len(ranges)}")
 
         # Read sound speed data - read all remaining lines as a matrix
-        ssp_data = []
-        line_num = 0
-        for line in f:
-            line_num += 1
-            line = line.strip()
-            if line:  # Skip empty lines
-                values = [float(x) for x in line.split()]
-                if len(values) != nranges:
-                    raise ValueError(f"SSP line {line_num} has {len(values)} range values, expected {nranges}")
-                ssp_data.append(values)
-
-        ssp_array = _np.array(ssp_data)
-        ndepths = ssp_array.shape[0]
-
-        # Create depth indices (actual depths would normally come from associated .env file)
-        if depths is None:
-            depths = _np.arange(ndepths, dtype=float)
-
-        if ndepths == 0 or len(depths) != ndepths:
-            raise ValueError("Wrong number of depths found in sound speed data file"
-                             f" (expected {ndepths}, found {ssp_array.shape[0]})")
-
-        df = _pd.DataFrame(ssp_array, index=depths, columns=ranges_m)
-        df.index.name = "depth"
-        return df
+        # (loadtxt skips empty lines and raises ValueError for ragged rows)
+        lines = f.read().splitlines()
+        try:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message="loadtxt: input contained no data")
+                ssp_array = _np.loadtxt(lines, dtype=_np.float64, comments="!", ndmin=2)
+        except ValueError:
+            _check_ssp_lines(lines, nranges)
+            raise
+        if ssp_array.shape[0] > 0 and ssp_array.shape[1] != nranges:
+            _check_ssp_lines(lines, nranges)
+
+        return ranges_m, ssp_array
+
+def _check_ssp_lines(lines: List[str], nranges: int) -> None:
+    """Raise ValueError naming the first line of SSP data without `nranges` values"""
+    for line_num, line in enumerate(lines, start=1):
+        values = line.partition('!')[0].split()
+        if values and len(values) != nranges:
+            raise ValueError(f"SSP line {line_num} has {len(values)} range values, expected {nranges}") from None
 
 def read_bty(fname: str) -> Tuple[NDArray[_np.float64], str]:
     """Read a bathymetry file used by Bellhop."""
-    fname, _ = _prepare_filename(fname, _File_Ext.bty, "BTY")
+    fname, _ = _prepare_filename(fname, _File_Ext.bty)
     return read_ati_bty(fname)
 
 def read_ati(fname: str) -> Tuple[NDArray[_np.float64], str]:
     """Read an altimetry file used by Bellhop."""
-    fname, _ = _prepare_filename(fname, _File_Ext.ati, "ATI")
+    fname, _ = _prepare_filename(fname, _File_Ext.ati)
     return read_ati_bty(fname)
 
+@_cache_by_file()
 def read_ati_bty(fname: str) -> Tuple[NDArray[_np.float64], str]:
     """Read an altimetry (.ati) or bathymetry (.bty) file used by BELLHOP.
 
@@ -503,27 +624,13 @@ def read_ati_bty(fname: str) -> Tuple[NDArray[_np.float64], str]:
         # Read interpolation type (usually 'L' or 'C')
         interp_type = _read_next_valid_line(f).strip("'\"")
         npoints = int(_read_next_valid_line(f))
-        ranges = []
-        depths = []
-        for i in range(npoints):
-            try:
-                line = _read_next_valid_line(f)
-            except EOFError:
-                break
-            parts = _parse_line(line)
-            if len(parts) >= 2:
-                ranges.append(float(parts[0]))  # Range in km
-                depths.append(float(parts[1]))  # Depth in m
-
-        if len(ranges) != npoints:
-            raise ValueError(f"Expected {npoints} altimetry/bathymetry points, but found {len(ranges)}")
+        data = _read_points(f, npoints, 2, "altimetry/bathymetry points")
 
         # Convert ranges from km to m for consistency with bellhop env structure
-        ranges_m = _np.array(ranges) * 1000
-        depths_array = _np.array(depths)
+        data[:, 0] *= 1000
 
         # Return as [range, depth] pairs
-        return _np.column_stack([ranges_m, depths_array]), _Maps.depth_interp[interp_type]
+        return data, _Maps.depth_interp[interp_type]
 
 def read_sbp(fname: str) -> NDArray[_np.float64]:
     """Read an source beam patterm (.sbp) file used by BELLHOP.
@@ -543,46 +650,35 @@ def read_sbp(fname: str) -> NDArray[_np.float64]:
         Numpy array with [angle, power] pairs
     """
 
-    fname, _ = _prepare_filename(fname, _File_Ext.sbp, "SBP")
+    fname, _ = _prepare_filename(fname, _File_Ext.sbp)
+    return _read_sbp_file(fname)
+
+@_cache_by_file()
+def _read_sbp_file(fname: str) -> NDArray[_np.float64]:
+    """Read the [angle, power] pairs from an .sbp file"""
     with open(fname, 'r') as f:
 
         # Read number of points
         npoints = int(_read_next_valid_line(f))
 
-        # Read range,depth pairs
-        angles = []
-        powers = []
-
-        for i in range(npoints):
-            try:
-                line = _read_next_valid_line(f)
-            except EOFError:
-                break
-            parts = _parse_line(line)
-            if len(parts) >= 2:
-                angles.append(float(parts[0]))  # Range in km
-                powers.append(float(parts[1]))  # Depth in m
-
-        if len(angles) != npoints:
-            raise ValueError(f"Expected {npoints} points, but found {len(angles)}")
-
-        # Return as [range, depth] pairs
-        return _np.column_stack([angles, powers])
+        # Return as [angle, power] pairs
+        return _read_points(f, npoints, 2, "points")
 
 def read_brc(fname: str) -> NDArray[_np.float64]:
     """Read a BRC file and return array of reflection coefficients.
 
     See `read_refl_coeff` for documentation, but use this function for extension checkking."""
-    fname, _ = _prepare_filename(fname, _File_Ext.brc, "BRC")
+    fname, _ = _prepare_filename(fname, _File_Ext.brc)
     return read_refl_coeff(fname)
 
 def read_trc(fname: str) -> NDArray[_np.float64]:
     """Read a TRC file and return array of reflection coefficients.
 
     See `read_refl_coeff` for documentation, but use this function for extension checkking."""
-    fname, _ = _prepare_filename(fname, _File_Ext.trc, "TRC")
+    fname, _ = _prepare_filename(fname, _File_Ext.trc)
     return read_refl_coeff(fname)
 
+@_cache_by_file()
 def read_refl_coeff(fname: str) -> NDArray[_np.float64]:
     """Read a reflection coefficient (.brc/.trc) file used by BELLHOP.
 
@@ -633,33 +729,13 @@ def read_refl_coeff(fname: str) -> NDArray[_np.float64]:
         # Read number of points
         npoints = int(_read_next_valid_line(f))
 
-        # Read range,depth pairs
-        theta = []
-        rmagn = []
-        rphas = []
-
-        for i in range(npoints):
-            try:
-                line = _read_next_valid_line(f)
-            except EOFError:
-                break
-            parts = _parse_line(line)
-            if len(parts) == 3:
-                theta.append(float(parts[0]))
-                rmagn.append(float(parts[1]))
-                rphas.append(float(parts[2]))
-
-        if len(theta) != npoints:
-            raise ValueError(f"Expected {npoints} reflection coefficient points, but found {len(theta)}")
-
-        # Return as [range, depth] pairs
-        return _np.column_stack([theta, rmagn, rphas])
+        # Return as [theta, rmag, rphase] triplets
+        return _read_points(f, npoints, 3, "reflection coefficient points")
 
 
 def read_arrivals(fname: str) -> _pd.DataFrame:
     """Read Bellhop arrivals file and parse data into a high level data structure"""
-    path = _ensure_file_exists(fname)
-    with path.open('rt') as f:
+    with _open_output(fname, 'rt') as f:
         hdr = f.readline()
         if hdr.find('2D') >= 0:
             freq = _read_array(f, (float,))
@@ -708,10 +784,23 @@ def read_arrivals(fname: str) -> _pd.DataFrame:
     return _pd.concat(arrivals)
 
 
-def read_shd(fname: str) -> _pd.DataFrame:
-    """Read Bellhop shd file and parse data into a high level data structure"""
-    path = _ensure_file_exists(fname)
-    with path.open('rb') as f:
+def read_shd(fname: str, raw: bool = False) -> Union[_pd.DataFrame, Tuple[NDArray[_np.complex128], NDArray[_np.float64], NDArray[_np.float64]]]:
+    """Read Bellhop shd file and parse data into a high level data structure
+
+    Parameters
+    ----------
+    fname : str
+        Path to .shd file
+    raw : bool, default=False
+        True to return the pressure array and receiver positions without a DataFrame wrapper
+
+    Returns
+    -------
+    pandas.DataFrame or tuple
+        Complex pressure indexed by receiver depth with receiver range columns, or if `raw`
+        is True a tuple of (pressure, receiver depths, receiver ranges) numpy arrays
+    """
+    with _open_output(fname, 'rb') as f:
         recl, = _unpack('i', f.read(4))
         # _title = str(f.read(80))
         f.seek(4*recl, 0)
@@ -726,19 +815,20 @@ def read_shd(fname: str) -> _pd.DataFrame:
         pos_r_depth = _unpack('f'*nrd, f.read(4*nrd))
         f.seek(36*recl, 0)
         pos_r_range = _unpack('f'*nrr, f.read(4*nrr))
-        pressure = _np.zeros((nrd, nrr), dtype=_np.complex128)
-        for ird in range(nrd):
-            recnum = 10 + ird
-            f.seek(recnum*4*recl, 0)
-            temp = _np.array(_unpack('f'*2*nrr, f.read(2*nrr*4)))
-            pressure[ird,:] = temp[::2] + 1j*temp[1::2]
+        # single source/angle/frequency: the receiver depth records are contiguous from record 10
+        f.seek(10*4*recl, 0)
+        temp = _np.fromfile(f, dtype=_np.float32, count=nrd*recl)
+        assert temp.size == nrd*recl, 'Invalid file format (pressure data truncated)'
+        # records hold interleaved (real, imag) float32 pairs, i.e. complex64 values
+        pressure = temp.reshape(nrd, recl)[:,:2*nrr].view(_np.complex64).astype(_np.complex128)
+    if raw:
+        return pressure, _np.array(pos_r_depth, dtype=_np.float64), _np.array(pos_r_range, dtype=_np.float64)
     return _pd.DataFrame(pressure, index=pos_r_depth, columns=pos_r_range)
 
 
 def read_rays(fname: str) -> _pd.DataFrame:
     """Read Bellhop rays file and parse data into a high level data structure"""
-    path = _ensure_file_exists(fname)
-    with path.open('rt') as f:
+    with _open_output(fname, 'rt') as f:
         f.readline()
         f.readline()
         f.readline()
@@ -753,9 +843,7 @@ def read_rays(fname: str) -> _pd.DataFrame:
                 break
             a = float(s)
             pts, sb, bb = _read_array(f, (int, int, int))
-            ray = _np.empty((pts, 2))
-            for k in range(pts):
-                ray[k,:] = _read_array(f, (float, float))
+            ray = _np.loadtxt(f, dtype=_np.float64, max_rows=pts, ndmin=2) if pts > 0 else _np.empty((0, 2))
             rays.append(_pd.DataFrame({
                 'angle_of_departure': [a],
                 'surface_bounces': [sb],
@@ -764,11 +852,12 @@ def read_rays(fname: str) -> _pd.DataFrame:
             }))
     return _pd.concat(rays)
 
-def _ensure_file_exists(fname: str) -> Path:
-    path = Path(fname)
-    if not path.exists():
-        raise RuntimeError(f"Bellhop did not generate expected output file: {path}")
-    return path
+def _open_output(fname: str, mode: str) -> IO[Any]:
+    """Open a Bellhop output file, treating a missing file as a failed run"""
+    try:
+        return open(fname, mode)
+    except FileNotFoundError:
+        raise RuntimeError(f"Bellhop did not generate expected output file: {fname}") from None
 
 def _read_array(f: IO[str], types: Tuple[Any, ...], dtype: type = str) -> Tuple[Any, ...]:
     """Wrapper around readline() to read in a 1D array of data"""
@@ -209,6 +209,8 @@ def generate_html_report(gcov_file: str, output_dir: str) -> Tuple[str, Dict[str
     <div class="code-container">
 """
 
+    # Collect the per-line rows and join once, rather than growing one large string
+    code_lines = []
     for line_data in coverage_data:
         line_class = "non-executable"
         if line_data['execution_count'] == '#####':
@@ -216,12 +218,13 @@ def generate_html_report(gcov_file: str, output_dir: str) -> Tuple[str, Dict[str
         elif line_data['executed'] and line_data['execution_count'].isdigit() and int(line_data['execution_count']) > 0:
             line_class = "executed"
 
-        html_content += f"""        <div class="code-line {line_class}">
+        code_lines.append(f"""        <div class="code-line {line_class}">
             <div class="line-number">{line_data['line_number']}</div>
             <div class="execution-count">{line_data['execution_count']}</div>
             <div class="source-code">{escape(line_data['source_code'])}</div>
         </div>
-"""
+""")
+    html_content += "".join(code_lines)
 
     html_content += """    </div>
 
@@ -324,6 +327,7 @@ def generate_index_html(coverage_reports: List[Tuple[str, Dict[str, float]]], ou
         <tbody>
 """
 
+    table_rows = []
     for report_file, summary in coverage_reports:
         source_name = report_file.replace('.coverage.html', '')
         line_pct = summary.get('line_percentage', 0)
@@ -335,14 +339,15 @@ def generate_index_html(coverage_reports: List[Tuple[str, Dict[str, float]]], ou
         branch_class = "high-coverage" if branch_pct >= 80 else "medium-coverage" if branch_pct >= 50 else "low-coverage"
         call_class = "high-coverage" if call_pct >= 80 else "medium-coverage" if call_pct >= 50 else "low-coverage"
 
-        html_content += f"""            <tr>
+        table_rows.append(f"""            <tr>
                 <td><code>{source_name}</code></td>
                 <td class="percentage {line_class}">{line_pct:.1f}%</td>
                 <td class="percentage {branch_class}">{branch_pct:.1f}%</td>
                 <td class="percentage {call_class}">{call_pct:.1f}%</td>
                 <td><a href="{report_file}">View Report</a></td>
             </tr>
-"""
+""")
+    html_content += "".join(table_rows)
 
     html_content += """        </tbody>
     </table>
@@ -372,9 +377,8 @@ def main() -> None:
     os.makedirs(output_dir, exist_ok=True)
 
     # Find all .gcov files
-    gcov_files = []
-    for pattern in ['**/*.gcov', '*/*.gcov', '*.gcov']:
-        gcov_files.extend(glob.glob(pattern, recursive=True))
+    # a recursive '**' also matches files at the top level and one directory down
+    gcov_files = glob.glob('**/*.gcov', recursive=True)
 
     if not gcov_files:
         print("No .gcov files found. Please run coverage analysis first.")
@@ -12,10 +12,44 @@ def no_bokeh_show(monkeypatch):
     monkeypatch.setattr(bokeh.plotting, "show", lambda *a, **k: None)
 
 
-def test_plot_env():
+@pytest.fixture(scope="module")
+def env():
+    return bh.create_env()
+
+
+@pytest.fixture(scope="module")
+def arrivals(env):
+    return bh.compute_arrivals(env)
+
+
+@pytest.fixture(scope="module")
+def rays(env):
+    return bh.compute_rays(env)
+
+
+@pytest.fixture(scope="module")
+def eigenrays(env):
+    return bh.compute_eigenrays(env)
+
+
+@pytest.fixture(scope="module")
+def tloss_env():
+    return bh.create_env(
+        receiver_depth=np.arange(0, 25, 5),
+        receiver_range=np.arange(0, 1000, 100),
+        beam_angle_min=-45,
+        beam_angle_max=45
+    )
+
+
+@pytest.fixture(scope="module")
+def tloss(tloss_env):
+    return bh.compute_transmission_loss(tloss_env)
+
+
+def test_plot_env(env):
     """Test plot_env function with default environment. Just check that there are no execution errors.
     """
-    env = bh.create_env()
     bhp.plot_env(env)
 
 
@@ -26,10 +60,9 @@ def test_plot_env_complex():
     bhp.plot_env(env)
 
 
-def test_plot_ssp():
+def test_plot_ssp(env):
     """Test plot_ssp function with default environment. Just check that there are no execution errors.
     """
-    env = bh.create_env()
     bhp.plot_ssp(env)
 
 
@@ -40,69 +73,45 @@ def test_plot_ssp_complex():
     bhp.plot_ssp(env)
 
 
-def test_plot_arrivals():
+def test_plot_arrivals(arrivals):
     """Test plot_arrivals function with computed arrivals. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    arrivals = bh.compute_arrivals(env)
     bhp.plot_arrivals(arrivals)
 
 
-def test_plot_arrivals_db():
+def test_plot_arrivals_db(arrivals):
     """Test plot_arrivals function in dB scale. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    arrivals = bh.compute_arrivals(env)
     bhp.plot_arrivals(arrivals, dB=True)
 
 
-def test_plot_rays():
+def test_plot_rays(rays):
     """Test plot_rays function with computed rays. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    rays = bh.compute_rays(env)
     bhp.plot_rays(rays)
 
 
-def test_plot_rays_with_env():
+def test_plot_rays_with_env(env, eigenrays):
     """Test plot_rays function with environment overlay. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    rays = bh.compute_eigenrays(env)
-    bhp.plot_rays(rays, env=env)
+    bhp.plot_rays(eigenrays, env=env)
 
 
-def test_plot_rays_inverted():
+def test_plot_rays_inverted(eigenrays):
     """Test plot_rays function with inverted colors. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    rays = bh.compute_eigenrays(env)
-    bhp.plot_rays(rays, invert_colors=True)
+    bhp.plot_rays(eigenrays, invert_colors=True)
 
 
-def test_plot_transmission_loss():
+def test_plot_transmission_loss(tloss):
     """Test plot_transmission_loss function with computed transmission loss. Just check that there are no execution errors.
     """
-    env = bh.create_env(
-        receiver_depth=np.arange(0, 25),
-        receiver_range=np.arange(0, 1000),
-        beam_angle_min=-45,
-        beam_angle_max=45
-    )
-    tloss = bh.compute_transmission_loss(env)
     bhp.plot_transmission_loss(tloss)
 
 
-def test_plot_transmission_loss_with_env():
+def test_plot_transmission_loss_with_env(tloss_env, tloss):
     """Test plot_transmission_loss function with environment overlay. Just check that there are no execution errors.
     """
-    env = bh.create_env(
-        receiver_depth=np.arange(0, 25),
-        receiver_range=np.arange(0, 1000),
-        beam_angle_min=-45,
-        beam_angle_max=45
-    )
-    tloss = bh.compute_transmission_loss(env)
-    bhp.plot_transmission_loss(tloss, env=env)
+    bhp.plot_transmission_loss(tloss, env=tloss_env)
 
 
@@ -3,10 +3,55 @@ import bellhop as bh
 import bellhop.pyplot as bhp
 import numpy as np
 
-def test_pyplot_env():
+import matplotlib
+matplotlib.use("Agg") # render off-screen, no GUI event loop or windows
+import matplotlib.pyplot as plt
+
+# Each test draws into the current figure, so close it to stop plots accumulating:
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close all matplotlib figures after each test."""
+    yield
+    plt.close('all')
+
+@pytest.fixture(scope="module")
+def env():
+    return bh.create_env()
+
+
+@pytest.fixture(scope="module")
+def arrivals(env):
+    return bh.compute_arrivals(env)
+
+
+@pytest.fixture(scope="module")
+def rays(env):
+    return bh.compute_rays(env)
+
+
+@pytest.fixture(scope="module")
+def eigenrays(env):
+    return bh.compute_eigenrays(env)
+
+
+@pytest.fixture(scope="module")
+def tloss_env():
+    return bh.create_env(
+        receiver_depth=np.arange(0, 25, 5),
+        receiver_range=np.arange(0, 1000, 100),
+        beam_angle_min=-45,
+        beam_angle_max=45
+    )
+
+
+@pytest.fixture(scope="module")
+def tloss(tloss_env):
+    return bh.compute_transmission_loss(tloss_env)
+
+
+def test_pyplot_env(env):
     """Test pyplot_env function with default environment. Just check that there are no execution errors.
     """
-    env = bh.create_env()
     bhp.pyplot_env(env)
 
 
@@ -17,10 +62,9 @@ def test_pyplot_env_complex():
     bhp.pyplot_env(env)
 
 
-def test_pyplot_ssp():
+def test_pyplot_ssp(env):
     """Test pyplot_ssp function with default environment. Just check that there are no execution errors.
     """
-    env = bh.create_env()
     bhp.pyplot_ssp(env)
 
 
@@ -31,67 +75,43 @@ def test_pyplot_ssp_complex():
     bhp.pyplot_ssp(env)
 
 
-def test_pyplot_arrivals():
+def test_pyplot_arrivals(arrivals):
     """Test pyplot_arrivals function with computed arrivals. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    arrivals = bh.compute_arrivals(env)
     bhp.pyplot_arrivals(arrivals)
 
 
-def test_pyplot_arrivals_db():
+def test_pyplot_arrivals_db(arrivals):
     """Test pyplot_arrivals function in dB scale. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    arrivals = bh.compute_arrivals(env)
     bhp.pyplot_arrivals(arrivals, dB=True)
 
 
-def test_pyplot_rays():
+def test_pyplot_rays(rays):
     """Test pyplot_rays function with computed rays. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    rays = bh.compute_rays(env)
     bhp.pyplot_rays(rays)
 
 
-def test_pyplot_rays_with_env():
+def test_pyplot_rays_with_env(env, eigenrays):
     """Test pyplot_rays function with environment overlay. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    rays = bh.compute_eigenrays(env)
-    bhp.pyplot_rays(rays, env=env)
+    bhp.pyplot_rays(eigenrays, env=env)
 
 
-def test_pyplot_rays_inverted():
+def test_pyplot_rays_inverted(eigenrays):
     """Test pyplot_rays function with inverted colors. Just check that there are no execution errors.
     """
-    env = bh.create_env()
-    rays = bh.compute_eigenrays(env)
-    bhp.pyplot_rays(rays, invert_colors=True)
+    bhp.pyplot_rays(eigenrays, invert_colors=True)
 
 
-def test_pyplot_transmission_loss():
+def test_pyplot_transmission_loss(tloss):
     """Test pyplot_transmission_loss function with computed transmission loss. Just check that there are no execution errors.
     """
-    env = bh.create_env(
-        receiver_depth=np.arange(0, 25),
-        receiver_range=np.arange(0, 1000),
-        beam_angle_min=-45,
-        beam_angle_max=45
-    )
-    tloss = bh.compute_transmission_loss(env)
     bhp.pyplot_transmission_loss(tloss)
 
 
-def test_pyplot_transmission_loss_with_env():
+def test_pyplot_transmission_loss_with_env(tloss_env, tloss):
     """Test pyplot_transmission_loss function with environment overlay. Just check that there are no execution errors.
     """
-    env = bh.create_env(
-        receiver_depth=np.arange(0, 25),
-        receiver_range=np.arange(0, 1000),
-        beam_angle_min=-45,
-        beam_angle_max=45
-    )
-    tloss = bh.compute_transmission_loss(env)
-    bhp.pyplot_transmission_loss(tloss, env=env)
+    bhp.pyplot_transmission_loss(tloss, env=tloss_env)
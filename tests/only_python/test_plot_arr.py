@@ -16,9 +16,8 @@ def no_bokeh_show(monkeypatch):
     monkeypatch.setattr(bokeh.plotting, "show", lambda *a, **k: None)
 
 
-def test_plot_arr():
-    """Test plot_env function with complex environment. Just check that there are no execution errors.
-    """
+@pytest.fixture(scope="module")
+def arr():
     dp = [[0, 40], [100, 30], [500, 35], [700, 20], [1000, 45]]
     rr = np.linspace(0,1000,1001)
     sf = np.array([[r, 0.5+0.5*np.sin(2*np.pi*0.005*r)] for r in rr]) # must be 0 at highest point
@@ -29,28 +28,20 @@ def test_plot_arr():
             beam_num=100,
             receiver_range=1000,
           )
-    arr = bh.compute_arrivals(env)
+    return bh.compute_arrivals(env)
 
+
+def test_plot_arr(arr):
+    """Test plot_env function with complex environment. Just check that there are no execution errors.
+    """
     with bhp.figure() as f:
         bhp.plot_arrivals(arr)
         bokeh.plotting.output_file(output_dir+"env_arr.html")
         bokeh.plotting.save(f)
 
-def test_plot_arr_db():
+def test_plot_arr_db(arr):
     """Test plot_env function with complex environment. Just check that there are no execution errors.
     """
-    dp = [[0, 40], [100, 30], [500, 35], [700, 20], [1000, 45]]
-    rr = np.linspace(0,1000,1001)
-    sf = np.array([[r, 0.5+0.5*np.sin(2*np.pi*0.005*r)] for r in rr]) # must be 0 at highest point
-
-    env = bh.create_env(
-            depth=dp,
-            surface=sf,
-            beam_num=100,
-            receiver_range=1000,
-          )
-    arr = bh.compute_arrivals(env)
-
     with bhp.figure() as f:
         bhp.plot_arrivals(arr,dB=True)
         bokeh.plotting.output_file(output_dir+"env_arr_db.html")
@@ -44,8 +44,8 @@ def test_plot_tl_long():
     dp = 50
     env = bh.create_env(
             depth=dp,
-            receiver_depth=np.arange(0, 50),
-            receiver_range=np.arange(0, 20000),
+            receiver_depth=np.linspace(0, 50, 11),
+            receiver_range=np.linspace(0, 20000, 201),
             beam_num=100,
           )
     tl = bh.compute_transmission_loss(env)
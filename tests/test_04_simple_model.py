@@ -20,18 +20,14 @@ def test_arrivals_bad_model():
         arr = bh.compute_arrivals(env, model="bellhop_not_found")
 
 
-def test_arrivals_no_model():
+def test_arrivals_no_model(monkeypatch):
     """Test with default settings to calculate arrival times. Catch error for no model found.
     """
 
-    saved_models = bh.main._models.copy()  # snapshot
-    try:
-        bh.main._models.clear()
-        with pytest.raises(ValueError, match=r"No suitable propagation model"):
-            env = bh.create_env()
-            arr = bh.compute_arrivals(env, debug=True)
-    finally:
-        bh.main._models[:] = saved_models  # restore contents in place
+    monkeypatch.setattr(bh.main, "_models", [])  # restored at teardown
+    with pytest.raises(ValueError, match=r"No suitable propagation model"):
+        env = bh.create_env()
+        arr = bh.compute_arrivals(env, debug=True)
 
 
 
@@ -22,3 +22,26 @@ def test_copy():
     assert env1.depth_max == 2000
     env2 = env1.copy()
     assert env2.depth_max == 2000
+    assert env2._checked
+
+    env2.frequency = 500
+    assert not env2._checked
+    assert env1._checked
+    assert env1.frequency != 500
+
+
+def test_check_cached():
+
+    env = bh.create_env(depth=40)
+    env.check()
+    assert env._checked
+    env.check()  # unchanged, so not re-checked
+    assert env._checked
+
+    env.source_depth = env.source_depth  # same object, still valid
+    assert env._checked
+
+    env.source_depth = 50.0  # deeper than the water
+    assert not env._checked
+    with pytest.raises(ValueError, match="source_depth cannot exceed water depth"):
+        env.check()
@@ -10,23 +10,29 @@ skip_if_coverage = pytest.mark.skipif(
     reason="Skipped during coverage run"
 )
 
-env = bh.read_env("tests/Dickins/DickinsB.env")
-bty,interp_bty = bh.read_bty("tests/Dickins/DickinsB.bty")
+@pytest.fixture(scope="module")
+def env():
+    env = bh.read_env("tests/Dickins/DickinsB.env")
+    bty,interp_bty = bh.read_bty("tests/Dickins/DickinsB.bty")
 
-print(interp_bty)
+    env["depth"] = bty
+    env["depth_interp"] = interp_bty
+    return env
 
-env["depth"] = bty
-env["depth_interp"] = interp_bty
+@pytest.fixture(scope="module")
+def tl(env):
+    return bh.compute_transmission_loss(env,fname_base="tests/Dickins/DickinsB_output",debug=True)
 
-tl = bh.compute_transmission_loss(env,fname_base="tests/Dickins/DickinsB_output",debug=True)
-tl_exp = bh.read_shd("tests/Dickins/DickinsB.shd")
+@pytest.fixture(scope="module")
+def tl_exp():
+    return bh.read_shd("tests/Dickins/DickinsB.shd")
 
-def test_DickensB():
+def test_DickensB(env, tl, tl_exp):
     """Test using a Bellhop example that ENV file parameters are being picked up properly.
     Just check that there are no execution errors.
     """
 
-    assert bty.shape[0] == 5,  "Should be N= 5 BTY data points"
+    assert env['depth'].shape[0] == 5,  "Should be N= 5 BTY data points"
 
     assert env['soundspeed_interp'] == 'linear', "SSPOPT = 'CVW' => C == linear"
     assert env['surface_boundary_condition'] == 'vacuum', "SSPOPT = 'CVW' => V == vacuum"
@@ -47,7 +53,7 @@ def test_DickensB():
 
 
 @skip_if_coverage
-def test_table_output():
+def test_table_output(tl, tl_exp):
     pdt.assert_frame_equal(
         tl, tl_exp,
         atol=1e-7,  # absolute tolerance
@@ -102,6 +108,11 @@ def test_DickensB_interpolate_depth():
     with pytest.warns(UserWarning):
         env7 = bh.read_env("tests/Dickins/DickinsB_interp_depth.env")
         env7 = bh.check_env(env7)
+    ssp = env7['soundspeed']
+    assert ssp.index[-1] == env7['depth_max']
+    assert ssp.index[-2] == 2500.0
+    assert ssp.iloc[-2, 0] == 1498.3
+    assert ssp.iloc[-1, 0] == pytest.approx(1498.3 + (1506.5-1498.3)*500/600)
 #        tl = bh.compute_transmission_loss(env7,fname_base="tests/Dickins/DickinsB_idepth_output",debug=True)
 #        assert tl is not None, "Interpolated values should allow Bellhop to run"
 
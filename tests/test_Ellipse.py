@@ -12,12 +12,6 @@ skip_if_coverage = pytest.mark.skipif(
 
 env = bh.read_env("tests/Ellipse/Ellipse.env")
 
-print(env["soundspeed"])
-print(env["depth"])
-print(env["depth_interp"])
-print(env["surface"])
-print(env["surface_interp"])
-
 def test_Ellipse_read_data():
     """Test using a Bellhop example that ENV file parameters are being picked up properly.
     Just check that the ATI/BTY files are read first.
@@ -10,12 +10,19 @@ skip_if_coverage = pytest.mark.skipif(
     reason="Skipped during coverage run"
 )
 
-env = bh.read_env("tests/MunkB_geo_rot/MunkB_geo_rot.env")
+@pytest.fixture(scope="module")
+def env():
+    return bh.read_env("tests/MunkB_geo_rot/MunkB_geo_rot.env")
 
-tl = bh.compute_transmission_loss(env,fname_base="tests/MunkB_geo_rot/MunkB_output",debug=True)
-tl_exp = bh.read_shd("tests/MunkB_geo_rot/MunkB_geo_rot.shd")
+@pytest.fixture(scope="module")
+def tl(env):
+    return bh.compute_transmission_loss(env,fname_base="tests/MunkB_geo_rot/MunkB_output",debug=True)
 
-def test_MunkB_geo_rot_A():
+@pytest.fixture(scope="module")
+def tl_exp():
+    return bh.read_shd("tests/MunkB_geo_rot/MunkB_geo_rot.shd")
+
+def test_MunkB_geo_rot_A(env, tl, tl_exp):
     """Test using a Bellhop example that ENV file parameters are being picked up properly.
     Just check that there are no execution errors.
     """
@@ -39,10 +46,12 @@ def test_MunkB_geo_rot_A():
 
 
 @skip_if_coverage
-def test_table_output():
-    pdt.assert_frame_equal(
-        tl, tl_exp,
-        check_names=False,
+def test_table_output(tl, tl_exp):
+    pdt.assert_index_equal(tl.index, tl_exp.index, check_names=False)
+    pdt.assert_index_equal(tl.columns, tl_exp.columns, check_names=False)
+    # compare the values as one array rather than column by column
+    np.testing.assert_allclose(
+        tl.to_numpy(), tl_exp.to_numpy(),
         atol=1e-8,  # absolute tolerance
         rtol=1e-5,  # relative tolerance
     )
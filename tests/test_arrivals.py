@@ -1,5 +1,6 @@
 import pytest
 import bellhop as bh
+import numpy as np
 
 def test_simple():
 
@@ -72,8 +73,7 @@ def test_simple():
         print(arrival_times)
         assert False, "Different number of arrivals!"
 
-    a_test = arrivals["time_of_arrival"] - t_arr_exp < 1e-6
-    assert( a_test.all() )
+    np.testing.assert_allclose(arrival_times.to_numpy(), t_arr_exp, atol=1e-6, rtol=0)
 
 
 def test_variable_soundspeed():
@@ -138,8 +138,7 @@ def test_variable_soundspeed():
         print(arrival_times)
         assert len(t_arr_exp) == len(arrival_times), "Different number of arrivals!"
 
-    a_test = arrivals["time_of_arrival"] - t_arr_exp < 1e-6
-    assert( a_test.all() )
+    np.testing.assert_allclose(arrival_times.to_numpy(), t_arr_exp, atol=1e-6, rtol=0)
 
 
 
@@ -189,8 +188,7 @@ def test_bathy():
         print(arrival_times)
         assert len(t_arr_exp) == len(arrival_times), "Different number of arrivals!"
 
-    a_test = arrival_times - t_arr_exp < 1e-6
-    assert( a_test.all() )
+    np.testing.assert_allclose(arrival_times.to_numpy(), t_arr_exp, atol=1e-6, rtol=0)
 
 
 def test_impulse_response():
@@ -13,6 +13,22 @@ from bellhop.environment import Environment
 from bellhop.constants import _Strings
 
 
+# Valid options for each field with a fixed set of values
+_valid_options = {
+    'soundspeed_interp': ['spline', 'linear', 'quadrilateral', 'pchip', 'hexahedral', 'nlinear', 'default'],
+    'depth_interp': ['linear', 'curvilinear'],
+    'bottom_boundary_condition': ['vacuum', 'acousto-elastic', 'rigid', 'from-file', 'default'],
+    'surface_boundary_condition': ['vacuum', 'acousto-elastic', 'rigid', 'from-file', 'default'],
+    'grid_type': ['rectilinear', 'irregular', 'default'],
+    'beam_type': ['hat-cartesian', 'hat-ray', 'gaussian-cartesian', 'gaussian-ray', 'default'],
+    'attenuation_units': [
+        'nepers per meter', 'frequency dependent', 'dB per meter', 'dB per wavelength',
+        'quality factor', 'loss parameter', 'default'
+    ],
+    'volume_attenuation': ['thorp', 'francois-garrison', 'biological', 'none'],
+}
+
+
 class TestEnvironmentValidation:
     """Test the Environment dataclass validation."""
 
@@ -28,25 +44,11 @@ class TestEnvironmentValidation:
         with pytest.raises(ValueError, match="Invalid value for 'soundspeed_interp'"):
             Environment(soundspeed_interp='invalid_interpolation')
 
-    def test_valid_soundspeed_interp_options(self):
-        """Test that all valid soundspeed interpolation options work."""
-        valid_options = ['spline', 'linear', 'quadrilateral', 'pchip', 'hexahedral', 'nlinear', 'default']
-        for option in valid_options:
-            config = Environment(soundspeed_interp=option)
-            assert config.soundspeed_interp == option
-
     def test_invalid_depth_interp(self):
         """Test that invalid depth interpolation raises ValueError."""
         with pytest.raises(ValueError, match="Invalid value for 'depth_interp'"):
             Environment(depth_interp='invalid_interpolation')
 
-    def test_valid_depth_interp_options(self):
-        """Test that all valid depth interpolation options work."""
-        valid_options = ['linear', 'curvilinear']
-        for option in valid_options:
-            config = Environment(depth_interp=option)
-            assert config.depth_interp == option
-
     def test_invalid_surface_interp(self):
         """Test that invalid surface interpolation raises ValueError."""
         with pytest.raises(ValueError, match="Invalid value for 'surface_interp'"):
@@ -62,70 +64,33 @@ class TestEnvironmentValidation:
         with pytest.raises(ValueError, match="Invalid value for 'surface_boundary_condition'"):
             Environment(surface_boundary_condition='invalid_boundary')
 
-    def test_valid_boundary_condition_options(self):
-        """Test that all valid boundary condition options work."""
-        valid_options = ['vacuum', 'acousto-elastic', 'rigid', 'from-file', 'default']
-        for option in valid_options:
-            config = Environment(bottom_boundary_condition=option)
-            assert config.bottom_boundary_condition == option
-
-    def test_valid_surface_boundary_condition_options(self):
-        """Test that all valid boundary condition options work."""
-        valid_options = ['vacuum', 'acousto-elastic', 'rigid', 'from-file', 'default']
-        for option in valid_options:
-            config = Environment(surface_boundary_condition=option)
-            assert config.surface_boundary_condition == option
-
     def test_invalid_grid_type(self):
         """Test that invalid grid type raises ValueError."""
         with pytest.raises(ValueError, match="Invalid value for 'grid_type'"):
             Environment(grid_type='invalid_grid')
 
-    def test_valid_grid_options(self):
-        """Test that all valid grid options work."""
-        valid_options = ['rectilinear', 'irregular', 'default']
-        for option in valid_options:
-            config = Environment(grid_type=option)
-            assert config.grid_type == option
-
     def test_invalid_beam_type(self):
         """Test that invalid beam type raises ValueError."""
         with pytest.raises(ValueError, match="Invalid value for 'beam_type'"):
             Environment(beam_type='invalid_beam')
 
-    def test_valid_beam_type_options(self):
-        """Test that all valid beam type options work."""
-        valid_options = ['hat-cartesian', 'hat-ray', 'gaussian-cartesian', 'gaussian-ray', 'default']
-        for option in valid_options:
-            config = Environment(beam_type=option)
-            assert config.beam_type == option
-
     def test_invalid_attenuation_units(self):
         """Test that invalid attenuation units raise ValueError."""
         with pytest.raises(ValueError, match="Invalid value for 'attenuation_units'"):
             Environment(attenuation_units='invalid_units')
 
-    def test_valid_attenuation_units_options(self):
-        """Test that all valid attenuation units options work."""
-        valid_options = [
-            'nepers per meter', 'frequency dependent', 'dB per meter', 'dB per wavelength',
-            'quality factor', 'loss parameter', 'default'
-        ]
-        for option in valid_options:
-            config = Environment(attenuation_units=option)
-            assert config.attenuation_units == option
-
     def test_invalid_volume_attenuation(self):
         """Test that invalid volume attenuation raises ValueError."""
         with pytest.raises(ValueError, match="Invalid value for 'volume_attenuation'"):
             Environment(volume_attenuation='invalid_attenuation')
 
-    def test_valid_volume_attenuation_options(self):
-        """Test that all valid volume attenuation options work."""
-        valid_options = ['thorp', 'francois-garrison', 'biological', 'none']
-        for option in valid_options:
-            config = Environment(volume_attenuation=option)
-            assert config.volume_attenuation == option
+    @pytest.mark.parametrize("field,option", [
+        (field, option) for field, options in _valid_options.items() for option in options
+    ])
+    def test_valid_options(self, field, option):
+        """Test that all valid options of each field work."""
+        config = Environment(**{field: option})
+        assert getattr(config, field) == option
 
 
 class TestDataclassIntegration:
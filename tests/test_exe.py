@@ -1,18 +1,16 @@
 import pytest
 import bellhop as bh
-import pandas as pd
+from contextlib import nullcontext
 
 
-def test_exe_pass():
-    bh.main.Bellhop()._run_exe("tests/Munk_SSP/MunkB_ray_rot", debug=True)
-    # no error => test passes
-
-def test_exe_fail():
-    with pytest.raises(RuntimeError, match=r"Execution of '.*' failed with return code"):
-        bh.main.Bellhop()._run_exe("tests/malformed_env/eof_ssp", debug=True)
-
-def test_exe_not_found():
-    with pytest.raises(FileNotFoundError, match=r"Executable (.*) not found in PATH."):
-        bh.main.Bellhop()._run_exe("tests/malformed_env/eof_ssp", debug=True, exe="bellhop_not_found.exe")
+@pytest.mark.parametrize("fname_base,exe,expectation", [
+    pytest.param("tests/Munk_SSP/MunkB_ray_rot", None, nullcontext(), id="pass"),
+    pytest.param("tests/malformed_env/eof_ssp", None,
+                 pytest.raises(RuntimeError, match=r"Execution of '.*' failed with return code"), id="fail"),
     # note that bellhop.py would give a better error message when reading that .env file
-
+    pytest.param("tests/malformed_env/eof_ssp", "bellhop_not_found.exe",
+                 pytest.raises(FileNotFoundError, match=r"Executable (.*) not found in PATH."), id="not_found"),
+])
+def test_exe(fname_base, exe, expectation):
+    with expectation:
+        bh.main.Bellhop()._run_exe(fname_base, debug=True, exe=exe)
@@ -10,10 +10,17 @@ skip_if_coverage = pytest.mark.skipif(
     reason="Skipped during coverage run"
 )
 
-env = bh.read_env("tests/VolAtt/free_FGB.env")
+@pytest.fixture(scope="module")
+def env():
+    return bh.read_env("tests/VolAtt/free_FGB.env")
 
-tl = bh.compute_transmission_loss(env,mode='coherent',fname_base="tests/VolAtt/FGB_output",debug=True)
-tl_exp = bh.read_shd("tests/VolAtt/free_FGB.shd")
+@pytest.fixture(scope="module")
+def tl(env):
+    return bh.compute_transmission_loss(env,mode='coherent',fname_base="tests/VolAtt/FGB_output",debug=True)
+
+@pytest.fixture(scope="module")
+def tl_exp():
+    return bh.read_shd("tests/VolAtt/free_FGB.shd")
 
 
 def test_simple():
@@ -29,7 +36,7 @@ def test_simple():
     assert len(arr) == 36, "Should be N=36 arrivals"
     # don't check values here, might do that later
 
-def test_FGB():
+def test_FGB(env, tl, tl_exp):
     """Test using a Bellhop example that ENV file parameters are being picked up properly.
     """
 
@@ -50,12 +57,22 @@ def test_FGB():
     assert (tl.shape == tl_exp.shape), "Incorrect/inconsistent number of TL values calculated"
     assert (tl.index == tl_exp.index).all(), "TL dataframe indexes not identical"
 
+def test_read_shd_raw(tl_exp):
+    pressure, depths, ranges = bh.read_shd("tests/VolAtt/free_FGB.shd", raw=True)
+    assert isinstance(pressure, np.ndarray)
+    assert pressure.shape == tl_exp.shape
+    assert np.array_equal(pressure, tl_exp.to_numpy())
+    assert np.array_equal(depths, tl_exp.index)
+    assert np.array_equal(ranges, tl_exp.columns)
+
 
 @skip_if_coverage
-def test_table_output():
-    pdt.assert_frame_equal(
-        tl, tl_exp,
-        check_names=False,
+def test_table_output(tl, tl_exp):
+    pdt.assert_index_equal(tl.index, tl_exp.index, check_names=False)
+    pdt.assert_index_equal(tl.columns, tl_exp.columns, check_names=False)
+    # compare the values as one array rather than column by column
+    np.testing.assert_allclose(
+        tl.to_numpy(), tl_exp.to_numpy(),
         atol=1e-4,  # absolute tolerance
         rtol=1e-6,  # relative tolerance
     )
@@ -19,13 +19,15 @@ ssp = [
     [30, 1535]   # 1535 m/s at the seabed
 ]
 
-# Create environment with variable sound speed profile
-env = bh.create_env(soundspeed=ssp, depth=30, soundspeed_interp="linear", beam_angle_min=-80, beam_angle_max=80)
+@pytest.fixture(scope="module")
+def arrival_times():
+    # Create environment with variable sound speed profile
+    env = bh.create_env(soundspeed=ssp, depth=30, soundspeed_interp="linear", beam_angle_min=-80, beam_angle_max=80)
+
+    # Compute arrivals
+    arrivals = bh.compute_arrivals(env,debug=True,fname_base="tests/_test_interp")
+    return arrivals["time_of_arrival"]
 
-# Compute arrivals
-arrivals = bh.compute_arrivals(env,debug=True,fname_base="tests/_test_interp")
-arrival_times = arrivals["time_of_arrival"]
-print(arrival_times)
 t_arr_exp = pd.Series([
     0.696581,
     0.692154,
@@ -56,7 +58,7 @@ t_arr_exp = pd.Series([
 
 
 @skip_if_coverage
-def test_interp_linear():
+def test_interp_linear(arrival_times):
     """Test BELLHOP with depth-dependent sound speed profile and linear interpolation.
 
     This is exactly the same test as `test_variable_soundspeed()` in `test_simple.py` but
@@ -71,7 +73,7 @@ def test_interp_linear():
       rtol=1e-4,  # relative tolerance
     )
 
-def test_spline():
+def test_spline(arrival_times):
     """Test spline interpolation for SSP. Changing interpolation changes the results so we only look for approximate matches."""
 
     env2 = bh.create_env(soundspeed=ssp, depth=30, soundspeed_interp="spline")
@@ -100,7 +102,7 @@ def test_spline_fail():
         bh.check_env(env2)
 
 
-def test_pchip():
+def test_pchip(arrival_times):
     """Test pchip interpolation for SSP. Changing interpolation changes the results so we only look for approximate matches."""
 
     env3 = bh.create_env(soundspeed=ssp, depth=30, soundspeed_interp="pchip")
@@ -118,7 +120,7 @@ def test_pchip():
 
 
 
-def test_nlinear():
+def test_nlinear(arrival_times):
     """Test nlinear interpolation for SSP. Changing interpolation changes the results so we only look for approximate matches."""
 
     env4 = bh.create_env(soundspeed=ssp, depth=30, soundspeed_interp="nlinear")
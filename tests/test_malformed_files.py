@@ -29,7 +29,7 @@ def test_malformed_ssp_count_mismatch():
 
 def test_malformed_ssp_insufficient_data():
     """Test SSP file where a line has too few data points"""
-    with pytest.raises((ValueError, IndexError)):
+    with pytest.raises(ValueError, match="SSP line 1 has 2 range values, expected 3"):
         bh.read_ssp("tests/malformed_files/insufficient_data_ssp.ssp")
 
 def test_malformed_sbp_count_mismatch():
@@ -65,5 +65,10 @@ def test_malformed_brc_count_mismatch():
 
 def test_malformed_brc_insufficient_data():
     """Test BRC file where a line has too few data points"""
-    with pytest.raises(ValueError, match="Expected 3 reflection coefficient points, but found 2"):
+    with pytest.raises(ValueError, match="Expected 3 reflection coefficient points with 3 values each"):
         bh.read_brc("tests/malformed_files/insufficient_data_brc.brc")
+
+def test_slash_terminated_bty():
+    """Test BTY file with a '/' terminator attached to the last value (valid list-directed input)"""
+    bty, interp = bh.read_bty("tests/malformed_files/slash_terminated_bty.bty")
+    assert bty.tolist() == [[0, 100], [10000, 200]]
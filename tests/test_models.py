@@ -21,18 +21,13 @@ def test_models_arg_task():
     with pytest.raises(ValueError,match="env and task should be both specified together"):
         models = bh.models(task="foobar")
 
-def test_models_task():
+@pytest.mark.parametrize("task", [
+        "coherent",
+        "foobar",  # I would expect this to error but it doesn't :)
+    ])
+def test_models_task(task):
 
     env = bh.create_env()
-    models = bh.models(env,"coherent")
-    print(models)
-    assert models is not None
-
-
-def test_models_task():
-    """I would expect this to error but it doesn't :)"""
-    env = bh.create_env()
-    models = bh.models(env,"foobar")
-    print("foobar model?")
+    models = bh.models(env,task)
     print(models)
     assert models is not None
@@ -3,7 +3,6 @@ import bellhop as bh
 import numpy as np
 import pandas as pd
 import pandas.testing as pdt
-import tempfile
 import os
 
 
@@ -44,7 +43,7 @@ def test_read_env_free_space():
     # but the parsing itself should work
 
 
-def test_read_env_round_trip():
+def test_read_env_round_trip(tmp_path):
     """Test creating an environment, writing it to ENV file, then reading it back."""
     # Create a test environment
     env_orig = bh.create_env(
@@ -64,36 +63,35 @@ def test_read_env_round_trip():
     )
     env_orig = bh.check_env(env_orig)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        fname_base = os.path.join(temp_dir, "test_env")
+    fname_base = str(tmp_path / "test_env")
 
-        # Create the Bellhop model and generate the env file
-        from bellhop.main import Bellhop
-        model = Bellhop()
-        fh_fd, fname_base = model._prepare_env_file(fname_base)
-        with os.fdopen(fh_fd, "w") as fh:
-            model._create_env_file(env_orig, 'R', fh, fname_base)
-        env_file = fname_base + '.env'
+    # Create the Bellhop model and generate the env file
+    from bellhop.main import Bellhop
+    model = Bellhop()
+    fh_fd, fname_base = model._prepare_env_file(fname_base)
+    with os.fdopen(fh_fd, "w") as fh:
+        model._create_env_file(env_orig, 'R', fh, fname_base)
+    env_file = fname_base + '.env'
 
-        # Read it back
-        env_read = bh.read_env(env_file)
+    # Read it back
+    env_read = bh.read_env(env_file)
 
-        # Compare key values (allowing for expected transformations)
-        assert env_read['name'] == env_orig['name']
-        assert env_read['frequency'] == env_orig['frequency']
-        assert env_read['depth'] == env_orig['depth']
-        assert env_read['bottom_soundspeed'] == env_orig['bottom_soundspeed']
-        assert env_read['beam_angle_min'] == env_orig['beam_angle_min']
-        assert env_read['beam_angle_max'] == env_orig['beam_angle_max']
-        assert env_read['beam_num'] == env_orig['beam_num']
+    # Compare key values (allowing for expected transformations)
+    assert env_read['name'] == env_orig['name']
+    assert env_read['frequency'] == env_orig['frequency']
+    assert env_read['depth'] == env_orig['depth']
+    assert env_read['bottom_soundspeed'] == env_orig['bottom_soundspeed']
+    assert env_read['beam_angle_min'] == env_orig['beam_angle_min']
+    assert env_read['beam_angle_max'] == env_orig['beam_angle_max']
+    assert env_read['beam_num'] == env_orig['beam_num']
 
-        # Sound speed gets converted to profile format
-        pdt.assert_frame_equal(env_read['soundspeed'], env_orig['soundspeed'])
+    # Sound speed gets converted to profile format
+    pdt.assert_frame_equal(env_read['soundspeed'], env_orig['soundspeed'])
 
-        # Arrays should match
-        np.testing.assert_array_equal(env_read['source_depth'], env_orig['source_depth'])
-        np.testing.assert_array_equal(env_read['receiver_depth'], env_orig['receiver_depth'])
-        np.testing.assert_array_equal(env_read['receiver_range'], env_orig['receiver_range'])
+    # Arrays should match
+    np.testing.assert_array_equal(env_read['source_depth'], env_orig['source_depth'])
+    np.testing.assert_array_equal(env_read['receiver_depth'], env_orig['receiver_depth'])
+    np.testing.assert_array_equal(env_read['receiver_range'], env_orig['receiver_range'])
 
 
 def test_read_env_missing_file():
@@ -131,23 +129,6 @@ def test_read_env_vector_parsing():
     assert env['receiver_range'][-1] == 100000.0  # Converted from km to m
 
 
-def test_read_env_vector_parsing():
-    """Test various vector formats are parsed correctly."""
-    env_file = 'examples/Munk/MunkB_ray.env'
-    env = bh.read_env(env_file)
-
-    # Check that compressed vector notation works (should have generated linearly spaced values)
-    assert len(env['receiver_depth']) == 2  # From "51" and "0.0 5000.0 /"
-    assert env['receiver_ndepth'] == 51  # From "51" and "0.0 5000.0 /"
-    assert env['receiver_depth'][0] == 0.0
-    assert env['receiver_depth'][-1] == 5000.0
-
-    assert len(env['receiver_range']) == 2  # From "1001" and "0.0 100.0 /"
-    assert env['receiver_nrange'] == 1001  # From "1001" and "0.0 100.0 /"
-    assert env['receiver_range'][0] == 0.0
-    assert env['receiver_range'][-1] == 100000.0  # Converted from km to m
-
-
 def test_read_env2e_dataframe():
 
     env1 = bh.create_env(soundspeed=[[0,1540], [5,1535], [10,1535], [20,1530]])
@@ -4,14 +4,18 @@ import numpy as np
 import pandas as pd
 import os
 
-def test_read_ssp_multi_range():
-    """Test reading .ssp file with multiple ranges"""
-    ssp_file = "tests/MunkB_geo_rot/MunkB_geo_rot.ssp"
+MUNK_SSP = "tests/MunkB_geo_rot/MunkB_geo_rot.ssp"
+MUNK_BTY = "tests/MunkB_geo_rot/MunkB_geo_rot.bty"
+DICKINS_BTY = "examples/Dickins/DickinsB.bty"
 
-    if not os.path.exists(ssp_file):
-        pytest.skip(f"Test file not found: {ssp_file}")
+# Checked once at collection rather than inside each test:
+_HAS_MUNK_SSP = os.path.exists(MUNK_SSP)
+_HAS_MUNK = _HAS_MUNK_SSP and os.path.exists(MUNK_BTY)
 
-    ssp = bh.read_ssp(ssp_file)
+@pytest.mark.skipif(not _HAS_MUNK_SSP, reason=f"Test file not found: {MUNK_SSP}")
+def test_read_ssp_multi_range():
+    """Test reading .ssp file with multiple ranges"""
+    ssp = bh.read_ssp(MUNK_SSP)
 
     # Multi-range file should return a pandas DataFrame for range-dependent modeling
     assert isinstance(ssp, pd.DataFrame), "Should return pandas DataFrame for multi-range SSP"
@@ -37,10 +41,20 @@ def test_read_ssp_multi_range():
     env['soundspeed'] = ssp
     assert isinstance(env['soundspeed'], pd.DataFrame), "Should be compatible with create_env"
 
-def test_read_ssp_single_range():
+@pytest.mark.skipif(not _HAS_MUNK_SSP, reason=f"Test file not found: {MUNK_SSP}")
+def test_read_ssp_raw():
+    """Test reading .ssp file as plain arrays"""
+    ssp = bh.read_ssp(MUNK_SSP)
+    values, depths, ranges = bh.read_ssp(MUNK_SSP, raw=True)
+
+    np.testing.assert_array_equal(values, ssp.values)
+    np.testing.assert_array_equal(depths, ssp.index.values)
+    np.testing.assert_array_equal(ranges, ssp.columns.values)
+
+def test_read_ssp_single_range(tmp_path):
     """Test reading .ssp file with single range"""
     # Create a test file with single range
-    test_file = "test_single_range.ssp"
+    test_file = tmp_path / "test_single_range.ssp"
     with open(test_file, 'w') as f:
         f.write("1\n")
         f.write("0.0\n")
@@ -48,35 +62,26 @@ def test_read_ssp_single_range():
         f.write("1520\n")
         f.write("1540\n")
 
-    try:
-        ssp = bh.read_ssp(test_file)
+    ssp = bh.read_ssp(str(test_file))
 
-        # Single-range file should return [depth, soundspeed] pairs
-        assert isinstance(ssp, pd.DataFrame), "Should return Pandas DataFrame"
-        assert ssp.ndim == 2, "Should be 2D array"
-        assert ssp.shape[0] == 3, "Should have 3 depth points"
-        assert ssp.shape[1] == 1, "Should have 1 column of data (depth is the index)"
+    # Single-range file should return [depth, soundspeed] pairs
+    assert isinstance(ssp, pd.DataFrame), "Should return Pandas DataFrame"
+    assert ssp.ndim == 2, "Should be 2D array"
+    assert ssp.shape[0] == 3, "Should have 3 depth points"
+    assert ssp.shape[1] == 1, "Should have 1 column of data (depth is the index)"
 
-        # Check depth values are sequential
-        expected_depths = np.array([0., 1., 2.])
-        np.testing.assert_array_equal(ssp.index.values, expected_depths)
-
-        # Check sound speed values
-        expected_speeds = np.array([[1500.], [1520.], [1540.]])
-        np.testing.assert_array_equal(ssp.values, expected_speeds)
+    # Check depth values are sequential
+    expected_depths = np.array([0., 1., 2.])
+    np.testing.assert_array_equal(ssp.index.values, expected_depths)
 
-    finally:
-        if os.path.exists(test_file):
-            os.remove(test_file)
+    # Check sound speed values
+    expected_speeds = np.array([[1500.], [1520.], [1540.]])
+    np.testing.assert_array_equal(ssp.values, expected_speeds)
 
+@pytest.mark.skipif(not os.path.exists(MUNK_BTY), reason=f"Test file not found: {MUNK_BTY}")
 def test_read_bty():
     """Test reading .bty file"""
-    bty_file = "tests/MunkB_geo_rot/MunkB_geo_rot.bty"
-
-    if not os.path.exists(bty_file):
-        pytest.skip(f"Test file not found: {bty_file}")
-
-    bty,interp_bty = bh.read_bty(bty_file)
+    bty,interp_bty = bh.read_bty(MUNK_BTY)
 
     # Should return [range, depth] pairs
     assert isinstance(bty, np.ndarray), "Should return numpy array"
@@ -91,14 +96,10 @@ def test_read_bty():
     # All depths should be 0 for this flat bathymetry file
     np.testing.assert_array_equal(bty[:, 1], np.zeros(30))
 
+@pytest.mark.skipif(not os.path.exists(DICKINS_BTY), reason=f"Test file not found: {DICKINS_BTY}")
 def test_read_bty_complex():
     """Test reading .bty file with varying depths"""
-    bty_file = "examples/Dickins/DickinsB.bty"
-
-    if not os.path.exists(bty_file):
-        pytest.skip(f"Test file not found: {bty_file}")
-
-    bty,interp_bty = bh.read_bty(bty_file)
+    bty,interp_bty = bh.read_bty(DICKINS_BTY)
 
     # Should return [range, depth] pairs
     assert isinstance(bty, np.ndarray), "Should return numpy array"
@@ -112,17 +113,12 @@ def test_read_bty_complex():
     # Depths should include the shallow section at 20 km
     assert bty[2, 1] == 500, "Depth at 20 km should be 500 m"
 
+@pytest.mark.skipif(not _HAS_MUNK, reason="Test files not found")
 def test_integration_with_env():
     """Test that read functions work with environment creation"""
-    ssp_file = "tests/MunkB_geo_rot/MunkB_geo_rot.ssp"
-    bty_file = "tests/MunkB_geo_rot/MunkB_geo_rot.bty"
-
-    if not (os.path.exists(ssp_file) and os.path.exists(bty_file)):
-        pytest.skip("Test files not found")
-
     # Read files
-    ssp = bh.read_ssp(ssp_file)
-    bty,interp_bty = bh.read_bty(bty_file)
+    ssp = bh.read_ssp(MUNK_SSP)
+    bty,interp_bty = bh.read_bty(MUNK_BTY)
 
     # Create environment
     env = bh.create_env()
@@ -144,15 +140,13 @@ def test_integration_with_env():
     assert isinstance(env["depth"], np.ndarray)
     assert env["depth"].shape == bty.shape
 
+@pytest.mark.skipif(not _HAS_MUNK, reason="Test files not found")
 def test_file_extensions():
     """Test that functions handle missing extensions correctly"""
     # Test without extension
     ssp_file = "tests/MunkB_geo_rot/MunkB_geo_rot"  # No .ssp extension
     bty_file = "tests/MunkB_geo_rot/MunkB_geo_rot"  # No .bty extension
 
-    if not (os.path.exists(ssp_file + ".ssp") and os.path.exists(bty_file + ".bty")):
-        pytest.skip("Test files not found")
-
     # Should work without extensions
     ssp = bh.read_ssp(ssp_file)
     bty,interp_bty = bh.read_bty(bty_file)
@@ -179,3 +173,44 @@ def test_file_not_found():
 
     with pytest.raises(FileNotFoundError):
         bh.read_sbp("nonexistent.sbp")
+
+def test_read_cache_invalidation(tmp_path):
+    """Test that repeated reads return independent copies and pick up file changes"""
+    test_file = str(tmp_path / "test_cache_sbp.sbp")
+    with open(test_file, 'w') as f:
+        f.write("2\n-180 10\n180 10\n")
+
+    sbp1 = bh.read_sbp(test_file)
+    sbp1[0, 1] = -99.0
+    sbp2 = bh.read_sbp(test_file)
+    assert sbp2[0, 1] == 10.0, "Cached result should not be modified by the caller"
+
+    st = os.stat(test_file)
+    with open(test_file, 'w') as f:
+        f.write("3\n-180 10\n0 20\n180 10\n")
+    os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000)) # a new modification time
+    sbp3 = bh.read_sbp(test_file)
+    assert sbp3.shape == (3, 2), "Modified file should be re-read"
+
+def test_read_cache_size_limit(tmp_path):
+    """Test that the file cache discards the least recently used entries"""
+    from bellhop.readers import _cache_by_file
+    calls = []
+
+    @_cache_by_file(maxsize=2)
+    def reader(fname):
+        calls.append(os.path.basename(fname))
+        return fname
+
+    fnames = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        fnames.append(str(tmp_path / name))
+        (tmp_path / name).write_text("x")
+
+    reader(fnames[0])
+    reader(fnames[1])
+    reader(fnames[0])  # cached, and now most recently used
+    reader(fnames[2])  # evicts b.txt
+    reader(fnames[0])
+    reader(fnames[1])
+    assert calls == ["a.txt", "b.txt", "c.txt", "b.txt"]
@@ -2,7 +2,7 @@ import pytest
 import bellhop as bh
 import numpy as np
 
-def test_sqrt_bug():
+def test_sqrt_bug(tmp_path):
 
     env = bh.create_env(name="Test sqrt bug")
 
@@ -21,19 +21,20 @@ def test_sqrt_bug():
     assert(env["receiver_range"].ndim == 1)
     assert(env["receiver_range"].size == nn)
 
-    arrivals = bh.compute_arrivals(env,debug=True,fname_base="tests/_test_sqrt")
+    arrivals = bh.compute_arrivals(env,debug=False,fname_base=str(tmp_path / "sqrt_bug"))
 
-    for i in range(len(env["receiver_range"])):
-        arr_subset = arrivals[arrivals.receiver_range_ndx == i]
-        print(f"{len(arr_subset)} arrivals for receiver range {env['receiver_range'][i]}")
-        assert len(arr_subset) > 0, f"No arrivals found for receiver range {env['receiver_range'][i]}"
+    # Sorted arrival amplitude magnitudes for each receiver range, from a single pass
+    amps = {
+        ndx: np.sort(np.abs(grp["arrival_amplitude"].to_numpy()))
+        for ndx, grp in arrivals.groupby("receiver_range_ndx")
+    }
 
-    for i in range(int(nn/2)):
-        arr_subset1 = arrivals[arrivals.receiver_range_ndx == i]
-        arr_subset2 = arrivals[arrivals.receiver_range_ndx == nn-i-1]
-        assert len(arr_subset1) == len(arr_subset2), f"Should have equal number of arrivals for range: ±{env['receiver_range'][i]}"
+    for i in range(nn):
+        assert i in amps, f"No arrivals found for receiver range {env['receiver_range'][i]}"
 
-        arr_amp1 = np.sort(np.abs(np.array(arr_subset1["arrival_amplitude"])))
-        arr_amp2 = np.sort(np.abs(np.array(arr_subset2["arrival_amplitude"])))
+    for i in range(nn//2):
+        arr_amp1 = amps[i]
+        arr_amp2 = amps[nn-i-1]
+        assert len(arr_amp1) == len(arr_amp2), f"Should have equal number of arrivals for range: ±{env['receiver_range'][i]}"
 
         np.testing.assert_allclose(arr_amp1, arr_amp2, rtol=1e-4, atol=1e-4)
@@ -8,7 +8,7 @@ def test_ssp_spline_points(): # not an error but anyway
     ssp = pd.DataFrame({ 'depth':[0,10,20,30], 'speed':[1540,1530,1520,1525]})
     env = bh.create_env(soundspeed=ssp,depth=30,soundspeed_interp="spline")
     env = bh.check_env(env)
-    arr = bh.compute_arrivals(env,debug=True)
+    arr = bh.compute_arrivals(env,debug=False)
 
 
 
@@ -35,6 +35,13 @@ def test_ssp_one_speed():
     pdt.assert_frame_equal(env1['soundspeed'],env3['soundspeed'])
 
 
+def test_ssp_too_shallow():
+    """An SSP that ends above the water depth is an error, not extrapolated."""
+    env = bh.create_env(depth=100, soundspeed=[[0, 1540], [50, 1530]])
+    with pytest.raises(ValueError, match="soundspeed array must reach the maximum water depth: 100"):
+        bh.check_env(env)
+
+
 def test_ssp_neg():
     env = bh.read_env("tests/simple/simple_neg_ssp")
     with pytest.raises(RuntimeError):